@@ -1,4 +1,6 @@
-from .base_manager import managerBasicConfig  # noqa: F401
+import pygame
+
+from .base_manager import DefaultThreadSystem, managerBasicConfig  # noqa: F401
 from .event_manager import getEventManager, notifyEventManagers  # noqa: F401, E501
 from .key_manager import getKeyListener, notifyKeyListeners  # noqa: F401, E501
 from .file_parser import JSONParser  # noqa: F401, E501
@@ -6,3 +8,27 @@ from .file_parser import JSONParser  # noqa: F401, E501
 
 def basicConfig(*args, **kwds):
     managerBasicConfig(*args, **kwds)
+
+
+def pumpEvents(timeout: int = 0) -> list[pygame.Event]:
+    """
+    Drains the pygame event queue in one call, and passes each event on to all
+    EventManagers and KeyListeners, in the order the events were posted.
+
+    If a timeout is given and the queue is empty, waits up to that long for an event
+    to arrive instead of returning immediately, letting the program sleep while idle.
+
+    :param timeout: Maximum time to wait for an event, in milliseconds. Defaults to
+    0, which never waits.
+    :return: The events that were handled, for any further processing.
+    """
+    events = pygame.event.get()
+    if not events and timeout > 0:
+        event = pygame.event.wait(timeout)
+        if event.type == pygame.NOEVENT:
+            return events
+        events = [event] + pygame.event.get()
+    for event in events:
+        notifyEventManagers(event)
+        notifyKeyListeners(event)
+    return events
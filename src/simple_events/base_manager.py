@@ -2,41 +2,170 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 import asyncio
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 import functools
+import inspect
+import logging
+import os
+import sys
 import threading
-from typing import Callable, Type
-from weakref import WeakSet
+from types import MethodType
+from typing import Any, Awaitable, Callable, Iterable, Mapping, Optional, Sequence, Type
+from weakref import WeakKeyDictionary, WeakValueDictionary
 
 import pygame
 
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Sentinel for single-lookup attribute checks.
+_MISSING = object()
+# Stand-in for classes without any live instances
+_NO_INSTANCES: Mapping[int, object] = {}
+
 
 @dataclass
 class _CallableSets:
     """
     A collection of callables, broken up by type
+
+    Methods are grouped under their class, so the instances of each class only need
+    to be looked up once per dispatch.
     """
 
-    concurrent_functions: list[Callable] = field(default_factory=list)
-    sequential_functions: list[Callable] = field(default_factory=list)
-    concurrent_methods: list[tuple[Callable, Type[object]]] = field(
-        default_factory=list
+    concurrent_functions: Sequence[Callable] = field(default_factory=list)
+    sequential_functions: Sequence[Callable] = field(default_factory=list)
+    concurrent_methods: Mapping[Type[object], Sequence[Callable]] = field(
+        default_factory=dict
     )
-    sequential_methods: list[tuple[Callable, Type[object]]] = field(
-        default_factory=list
+    sequential_methods: Mapping[Type[object], Sequence[Callable]] = field(
+        default_factory=dict
     )
 
 
+def _group_methods(
+    pairs: Iterable[tuple[Callable, Type[object]]],
+) -> dict[Type[object], list[Callable]]:
+    """
+    Groups method/class pairs by their class, preserving the order of the methods.
+
+    :param pairs: Method and class pairs, as stored in the class listener registries
+    :return: A dict with classes as keys, and lists of their methods as values
+    """
+    grouped: dict[Type[object], list[Callable]] = {}
+    for method, cls in pairs:
+        grouped.setdefault(cls, []).append(method)
+    return grouped
+
+
 class _BaseThreadSystem(ABC):
 
     @abstractmethod
     def start_thread(self, callable: Callable, *args) -> None: ...
 
+    def start_batch(self, calls: list[tuple[Callable, tuple]]) -> None:
+        """
+        Starts a group of callables, such as all concurrent listeners of an event.
+
+        :param calls: Pairs of callables and the arguments they are called with
+        """
+        for callable, args in calls:
+            self.start_thread(callable, *args)
+
+    def shutdown(self) -> None:
+        """
+        Releases any resources held by the thread system.
+        """
+
+
+def _default_max_workers() -> int:
+    """
+    Sizes the worker pool for the running interpreter. With the GIL, listeners only
+    overlap while blocked, so extra workers cover waiting ones. On free-threaded
+    builds they run in parallel, so one worker per CPU avoids oversubscribing.
+    """
+    cpu_count = os.cpu_count() or 1
+    is_gil_enabled: Callable[[], bool] = getattr(sys, "_is_gil_enabled", lambda: True)
+    if not is_gil_enabled():
+        return cpu_count
+    return cpu_count * 2
+
 
 class DefaultThreadSystem(_BaseThreadSystem):
+    """
+    Runs concurrent callables on a persistent pool of worker threads, rather than
+    starting a new thread for every call.
+
+    An existing executor may be supplied instead, such as to share one pool between
+    several managers. A supplied executor is left running by shutdown, since its
+    owner may still be using it. Executors do not expose their size, so max_workers
+    should be given alongside one to match its worker count.
+    """
+
+    def __init__(
+        self, max_workers: Optional[int] = None, executor: Optional[Executor] = None
+    ) -> None:
+        self.max_workers: int = max_workers or _default_max_workers()
+        self._executor: Executor | None = executor
+        self._owns_executor: bool = executor is None
+        # Guards creating and shutting down the pool, so concurrent notifies cannot
+        # each build one
+        self._executor_lock = threading.Lock()
 
     def start_thread(self, callable, *args):
-        threading.Thread(target=callable, args=args).start()
+        self._get_executor().submit(_run_calls, [(callable, args)])
+
+    def start_batch(self, calls: list[tuple[Callable, tuple]]) -> None:
+        """
+        Splits the calls into at most one task per worker, so a busy event does not
+        queue up a task for every listener.
+
+        :param calls: Pairs of callables and the arguments they are called with
+        """
+        if not calls:
+            return
+        executor = self._get_executor()
+        task_count = min(len(calls), self.max_workers)
+        for index in range(task_count):
+            executor.submit(_run_calls, calls[index::task_count])
+
+    def _get_executor(self) -> Executor:
+        executor = self._executor
+        if executor is None:
+            with self._executor_lock:
+                executor = self._executor
+                if executor is None:
+                    executor = self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="simple_events",
+                    )
+        return executor
+
+    def shutdown(self) -> None:
+        """
+        Shuts down the worker pool without waiting for running callables to finish.
+        A new pool is created if another callable is started afterwards.
+        """
+        if not self._owns_executor:
+            return
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+def _run_calls(calls: list[tuple[Callable, tuple]]) -> None:
+    """
+    Calls each callable in turn, logging any errors so that one failing listener
+    does not prevent the rest from being called.
+
+    :param calls: Pairs of callables and the arguments they are called with
+    """
+    for callable, args in calls:
+        try:
+            callable(*args)
+        except Exception:
+            logger.exception("Exception raised by concurrent listener %s", callable)
 
 
 class AsyncThreadSystem(_BaseThreadSystem):
@@ -44,19 +173,55 @@ class AsyncThreadSystem(_BaseThreadSystem):
         asyncio.create_task(callable(*args))
 
 
+class _hybridmethod:
+    """
+    A method that binds to the instance when called on one, and to the class
+    otherwise.
+    """
+
+    def __init__(self, func: Callable) -> None:
+        self.func = func
+        functools.update_wrapper(self, func)  # type: ignore
+
+    def __get__(self, instance: object, owner: type) -> Callable:
+        return MethodType(self.func, owner if instance is None else instance)
+
+
 class BaseManager(ABC):
     thread_system: _BaseThreadSystem = DefaultThreadSystem()
 
     def __init__(self, handle: str) -> None:
         self.handle: str = handle
         # Registered object as key, instances of object as values
-        self._class_listener_instances: dict[Type[object], WeakSet[object]] = {}
+        # Instances are keyed by id, so they need not be hashable, and instances that
+        # compare equal are still tracked separately.
+        self._class_listener_instances: dict[
+            Type[object], WeakValueDictionary[int, object]
+        ] = {}
         # Assigned object as key, associated methods as values
         self._assigned_classes: dict[Type[object], list[Callable]] = {}
+        # Tagged method as key, tag data consumed from it as values
+        # Kept so subclasses registered after the method's own class still find it.
+        self._captured_tags: WeakKeyDictionary[Callable, list[tuple]] = (
+            WeakKeyDictionary()
+        )
+        # Guards the registries while they are changed or snapshotted for dispatch
+        self._lock = threading.RLock()
 
     # def __init_subclass__(cls) -> None:
     #     cls.thread_system = DefaultThreadSystem()
 
+    @_hybridmethod
+    def shutdown(self) -> None:
+        """
+        Shuts down the thread system used for concurrent functions and methods.
+        Called on the class, this is the shared thread system. Called on a manager,
+        this is the manager's own thread system, if it has been given one, and the
+        shared one is left running for the other managers.
+        """
+        if isinstance(self, type) or "thread_system" in vars(self):
+            self.thread_system.shutdown()
+
     def sequential(self, func: Callable) -> Callable:
         """
         Marks a function as to be run sequentially.
@@ -77,8 +242,10 @@ class BaseManager(ABC):
         :param func: The function to be cleared
         :return: the cleared function
         """
-        if hasattr(func, "_runs_sequential"):
+        try:
             delattr(func, "_runs_sequential")
+        except AttributeError:
+            pass  # Wasn't marked sequential to begin with.
         return func
 
     def register_class(self, cls: Type[object]) -> Type[object]:
@@ -92,21 +259,46 @@ class BaseManager(ABC):
         # Mypy will throw an error here because it thinks this is illegal.
         # Hijacking an init is illegal? Guess I'm going to jail then.
         cls.__init__ = self._modify_init(cls.__init__)  # type: ignore
-        # Add all of the tagged methods to the callables list
-        for method in cls.__dict__.values():
-            if not hasattr(method, "_assigned_managers"):
-                continue  # No point checking something untagged.
-            _assigned_managers = getattr(method, "_assigned_managers", [])
-            self._verify_manager(cls, method, _assigned_managers)
-            if len(_assigned_managers) == 0:
-                # We cleaned up the assignments to this handler, but other handlers
-                # might have yet to check. If all have cleaned up, we can remove the
-                # hanging attribute.
-                delattr(method, "_assigned_managers")
-                # Now there's no sign we modified the method.
+        # Add all of the tagged methods to the callables list, including those
+        # inherited from base classes.
+        seen_names: set[str] = set()
+        for base in cls.__mro__:
+            for name, method in vars(base).items():
+                if name in seen_names:
+                    continue  # Overridden further down the hierarchy
+                seen_names.add(name)
+                self._process_tagged(cls, method, consume=base is cls)
 
         return cls
 
+    def _process_tagged(
+        self, cls: Type[object], method: Callable, consume: bool = True
+    ) -> None:
+        """
+        Captures a method for cls if it has been tagged by this manager, and removes
+        the tag once every assigned manager has captured it.
+
+        :param cls: Class being registered
+        :param method: Attribute of cls, or of one of its bases
+        :param consume: Whether the tag is removed after capturing, defaults to True.
+        Tags on inherited methods are left in place for other subclasses.
+        """
+        _assigned_managers = getattr(method, "_assigned_managers", _MISSING)
+        if _assigned_managers is _MISSING:
+            if not consume:
+                # The tag may have been cleaned up when the method's own class was
+                # registered, so use the data captured then.
+                for tag_data in self._get_captured_tags(method):
+                    self._capture_method(cls, method, tag_data)
+            return  # No point checking something untagged.
+        self._verify_manager(cls, method, _assigned_managers, consume)
+        if consume and len(_assigned_managers) == 0:
+            # We cleaned up the assignments to this handler, but other handlers
+            # might have yet to check. If all have cleaned up, we can remove the
+            # hanging attribute.
+            delattr(method, "_assigned_managers")
+            # Now there's no sign we modified the method.
+
     def notify(self, event: pygame.Event) -> None:
         """
         Finds all listeners for a given event, and calls them in their respective modes
@@ -137,26 +329,93 @@ class BaseManager(ABC):
         callables = self._get_callables(event)
         self._handle_sequential(event, callables)
 
+    async def notify_async(self, event: pygame.Event) -> None:
+        """
+        Finds all listeners for a given event, and calls them from within the running
+        event loop. Concurrent coroutine functions are awaited together, while
+        concurrent regular functions are run in the loop's default executor.
+        Sequential listeners are called one at a time, as with notify.
+
+        :param event: Target event for the listeners
+        """
+        loop = asyncio.get_running_loop()
+        callables = self._get_callables(event)
+        awaitables: list[Awaitable[Any]] = []
+        for function in callables.concurrent_functions:
+            awaitables.append(self._make_awaitable(loop, function, event))
+        for cls, methods in callables.concurrent_methods.items():
+            instances = tuple(
+                self._class_listener_instances.get(cls, _NO_INSTANCES).values()
+            )
+            for method in methods:
+                for instance in instances:
+                    awaitables.append(
+                        self._make_awaitable(loop, method, instance, event)
+                    )
+        # Gathering schedules the concurrent calls before the sequential ones run.
+        gathered = asyncio.gather(*awaitables)
+        try:
+            self._handle_sequential(event, callables)
+        finally:
+            # Still awaited if a sequential listener raises, so the concurrent calls
+            # are not left running unobserved.
+            await gathered
+
+    def notify_threadsafe(
+        self, event: pygame.Event, loop: asyncio.AbstractEventLoop
+    ) -> Future:
+        """
+        Schedules notify_async on an event loop running in another thread, such as
+        when the pygame event pump and the event loop live in separate threads.
+
+        :param event: Target event for the listeners
+        :param loop: The event loop the listeners are to be called in
+        :return: A future that resolves once all listeners have finished
+        """
+        return asyncio.run_coroutine_threadsafe(self.notify_async(event), loop)
+
+    @staticmethod
+    def _make_awaitable(
+        loop: asyncio.AbstractEventLoop, callable: Callable, *args
+    ) -> Awaitable[Any]:
+        if inspect.iscoroutinefunction(callable):
+            return callable(*args)
+        return loop.run_in_executor(None, callable, *args)
+
     @abstractmethod
     def _get_callables(self, event: pygame.Event) -> _CallableSets: ...
 
     def _handle_concurrent(self, event: pygame.Event, callables: _CallableSets) -> None:
-        for function in callables.concurrent_functions:
-            self.thread_system.start_thread(function, event)
-            # threading.Thread(target=function, args=(event,)).start()
-        for method, cls in callables.concurrent_methods:
-            instances = self._class_listener_instances.get(cls, WeakSet())
-            for instance in instances:
-                self.thread_system.start_thread(method, instance, event)
-                # threading.Thread(target=method, args=(instance, event)).start()
+        # Called for every event, so lookups are bound to locals outside the loops
+        get_instances = self._class_listener_instances.get
+        calls: list[tuple[Callable, tuple]] = [
+            (function, (event,)) for function in callables.concurrent_functions
+        ]
+        add_call = calls.append
+        for cls, methods in callables.concurrent_methods.items():
+            # Snapshot once per class, rather than walking the weak mapping again for
+            # every method. This also shields the loops from instances being
+            # created or collected on other threads mid-dispatch.
+            instances = tuple(get_instances(cls, _NO_INSTANCES).values())
+            if not instances:
+                continue
+            for method in methods:
+                for instance in instances:
+                    add_call((method, (instance, event)))
+        if calls:
+            self.thread_system.start_batch(calls)
 
     def _handle_sequential(self, event: pygame.Event, callables: _CallableSets) -> None:
         for function in callables.sequential_functions:
             function(event)
-        for method, cls in callables.sequential_methods:
-            instances = self._class_listener_instances.get(cls, WeakSet())
-            for instance in instances:
-                method(instance, event)
+        get_instances = self._class_listener_instances.get
+        for cls, methods in callables.sequential_methods.items():
+            instances = tuple(get_instances(cls, _NO_INSTANCES).values())
+            if not instances:
+                continue
+            for method in methods:
+                for instance in instances:
+                    method(instance, event)
 
     def _add_instance(self, cls: Type[object], instance: object) -> None:
         """
@@ -165,7 +424,15 @@ class BaseManager(ABC):
         :param cls: The class of the instance
         :param instance: The new instance being captured
         """
-        self._class_listener_instances.setdefault(cls, WeakSet()).add(instance)
+        instances = self._class_listener_instances.get(cls)
+        if instances is None:
+            # Only build a new mapping for the first instance of the class.
+            # setdefault keeps this atomic, so instances of the class created at
+            # the same time on other threads all land in the same mapping.
+            instances = self._class_listener_instances.setdefault(
+                cls, WeakValueDictionary()
+            )
+        instances[id(instance)] = instance
 
     @abstractmethod
     def _capture_method(
@@ -186,12 +453,13 @@ class BaseManager(ABC):
 
         # Although I suppose if you're reading this, it got published, which means
         # I got it to work properly.
-        assigned_managers: list[tuple[BaseManager, tuple]] = []
-        if hasattr(method, "_assigned_managers"):
-            # Deja vu? This isn't the first assignment, so we need to pull the
-            # previous ones first.
-            assigned_managers = getattr(method, "_assigned_managers", [])
-        assigned_managers.append((self, tag_data))
+        # Deja vu? If this isn't the first assignment, we need to pull the
+        # previous ones first.
+        assigned_managers: dict[BaseManager, list[tuple]] = getattr(
+            method, "_assigned_managers", {}
+        )
+        # A manager could be assigned multiple times for multiple events.
+        assigned_managers.setdefault(self, []).append(tag_data)
         setattr(method, "_assigned_managers", assigned_managers)
         return method
 
@@ -199,30 +467,35 @@ class BaseManager(ABC):
         self,
         cls: Type[object],
         method: Callable,
-        managers: list[tuple[BaseManager, tuple]],
+        managers: dict[BaseManager, list[tuple]],
+        consume: bool = True,
     ) -> None:
         """
-        Checks the list of assigned managers for a method and captures it if it is
-        assigned to the calling manager
+        Checks the assigned managers for a method and captures it for each assignment
+        made by the calling manager. The assignments are then removed, so the tag
+        attribute can be cleaned up once every manager has checked, and kept by the
+        manager for any subclasses registered later.
 
         :param cls: Class of the object being processed
         :param method: Method of cls being registered
-        :param managers: list of managers and tag data.
+        :param managers: dict of managers and their tag data.
+        :param consume: Whether the assignments are removed, defaults to True
         """
-        _indexes_to_remove: list[int] = []
-        for index, (manager, tag_data) in enumerate(managers):
-            # A manager could be assigned multiple times for multiple events.
-            if manager is not self:
-                continue
+        assignments: Sequence[tuple]
+        if consume:
+            assignments = managers.pop(self, ())
+            if assignments:
+                self._captured_tags.setdefault(method, []).extend(assignments)
+        else:
+            assignments = managers.get(self) or self._get_captured_tags(method)
+        for tag_data in assignments:
             self._capture_method(cls, method, tag_data)
-            # Whoops, undefined behavior
-            # managers.pop(index)
-            _indexes_to_remove.append(index)
-            break
-        # Need to clean up the processed indices to we can remove the tag attribute
-        # from the method.
-        for index in reversed(_indexes_to_remove):
-            managers.pop(index)
+
+    def _get_captured_tags(self, method: Callable) -> Sequence[tuple]:
+        try:
+            return self._captured_tags.get(method, ())
+        except TypeError:
+            return ()  # Not weakly referenceable, so it was never captured
 
     def _modify_init(self, init: Callable) -> Callable:
         """
@@ -232,24 +505,26 @@ class BaseManager(ABC):
         :param init: The initializer function of a class being registered.
         :return: The modified init function
         """
-        functools.wraps(init)  # Needs this
+        # Bound once here so each instantiation only reads closure variables
+        add_instance = self._add_instance
 
-        def wrapper(*args, **kwds):
-            # args[0] of a non-class, non-static method is the instance
+        @functools.wraps(init)
+        def wrapper(instance, /, *args, **kwds):
+            # Positional-only, so an init parameter named instance is still passed on
             # This is called whenever the class is instantiated,
             # and the instance is extracted and can be stored
-            instance = args[0]
-            cls = instance.__class__
             # No need to check for the instance, each only calls this once
-            self._add_instance(cls, instance)
-            # self._class_listener_instances.setdefault(cls, WeakSet()).add(instance)
-            return init(*args, **kwds)
+            add_instance(instance.__class__, instance)
+            return init(instance, *args, **kwds)
 
         return wrapper
 
 
 def managerBasicConfig(*args, **kwds) -> None:
+    BaseManager.thread_system.shutdown()
     if kwds.get("is_async", False):
         BaseManager.thread_system = AsyncThreadSystem()
     else:
-        BaseManager.thread_system = DefaultThreadSystem()
+        BaseManager.thread_system = DefaultThreadSystem(
+            kwds.get("max_workers", None), kwds.get("executor", None)
+        )
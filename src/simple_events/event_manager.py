@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import logging
-from typing import Callable, Optional, Type
+import sys
+from typing import Callable, Optional, Sequence, Type
+from weakref import WeakKeyDictionary
 
-from .base_manager import BaseManager, _CallableSets
+from .base_manager import BaseManager, _CallableSets, _group_methods
 
 import pygame
 
@@ -12,13 +14,20 @@ logger: logging.Logger = logging.getLogger(__name__)
 
 class EventManager(BaseManager):
     handlers: dict[str, EventManager] = {}
+    # Pygame event as key, managers with listeners for that event as values
+    # Managers are held weakly, and checked against handlers when notified, since
+    # handlers may be changed directly.
+    _managers_by_event: dict[int, WeakKeyDictionary[EventManager, None]] = {}
 
     def __init__(self, handle: str) -> None:
         super().__init__(handle)
 
         # --------Basic function assignment--------
-        # Pygame event as key, list of functions as values
-        self._listeners: dict[tuple[int, bool], list[Callable]] = {}
+        # Pygame event as key, functions as values
+        # A dict is used as an ordered set, for quick removal.
+        self._listeners: dict[tuple[int, bool], dict[Callable, None]] = {}
+        # Inversion of _listeners. Function as key, listener keys as values
+        self._listener_keys: dict[Callable, list[tuple[int, bool]]] = {}
 
         # --------Class method assignment--------
         # Pygame event key, method and affected object as values
@@ -28,6 +37,11 @@ class EventManager(BaseManager):
         # Inversion of _class_listeners. Method as key, event id as values
         self._class_listener_events: dict[Callable, list[int]] = {}
 
+        # --------Dispatch cache--------
+        # Pygame event as key, prebuilt callables for that event as values
+        # Entries are dropped whenever the listeners for their event change.
+        self._callables_cache: dict[int, _CallableSets] = {}
+
     def register(self, event_type: int) -> Callable:
         """
         Takes a callable item such as a function, and places it in the appropriate set
@@ -39,9 +53,15 @@ class EventManager(BaseManager):
         """
 
         def decorator(listener: Callable) -> Callable:
-            is_concurrent = not hasattr(listener, "_runs_sequential")
-            event_list = self._listeners.setdefault((event_type, is_concurrent), [])
-            event_list.append(listener)
+            with self._lock:
+                is_concurrent = not hasattr(listener, "_runs_sequential")
+                listener_key = (event_type, is_concurrent)
+                event_set = self._listeners.setdefault(listener_key, {})
+                if listener not in event_set:
+                    event_set[listener] = None
+                    self._listener_keys.setdefault(listener, []).append(listener_key)
+                self._callables_cache.pop(event_type, None)
+                self._track_event(event_type)
             return listener
 
         return decorator
@@ -55,11 +75,22 @@ class EventManager(BaseManager):
         :param event_type: Pygame event type to which the function is to be
         removed, defaults to None
         """
-        for (event, _), call_list in self._listeners.items():
-            if event_type is not None and event != event_type:
-                continue
-            if func in call_list:
-                call_list.remove(func)
+        with self._lock:
+            # Only the events the function was registered to are visited
+            listener_keys = self._listener_keys.pop(func, ())
+            remaining: list[tuple[int, bool]] = []
+            for listener_key in listener_keys:
+                event = listener_key[0]
+                if event_type is not None and event != event_type:
+                    remaining.append(listener_key)
+                    continue
+                call_set = self._listeners.get(listener_key)
+                if call_set and func in call_set:
+                    del call_set[func]
+                    self._callables_cache.pop(event, None)
+                    self._untrack_event(event)
+            if remaining:
+                self._listener_keys[func] = remaining
 
     def _capture_method(self, cls, method, tag_data):
         """
@@ -73,17 +104,20 @@ class EventManager(BaseManager):
         is_concurrent = not hasattr(method, "_runs_sequential")
         event_type = tag_data[0]  # Only piece of data
 
-        # -----Add to Class Listeners-----
-        class_listeners = self._class_listeners.setdefault(
-            (event_type, is_concurrent), []
-        )
-        class_listeners.append((method, cls))
+        with self._lock:
+            # -----Add to Class Listeners-----
+            class_listeners = self._class_listeners.setdefault(
+                (event_type, is_concurrent), []
+            )
+            class_listeners.append((method, cls))
+            self._callables_cache.pop(event_type, None)
+            self._track_event(event_type)
 
-        # -----Add to Class Listener Events-----
-        self._class_listener_events.setdefault(method, []).append(event_type)
+            # -----Add to Class Listener Events-----
+            self._class_listener_events.setdefault(method, []).append(event_type)
 
-        # -----Add to Assigned Classes-----
-        self._assigned_classes.setdefault(cls, []).append(method)
+            # -----Add to Assigned Classes-----
+            self._assigned_classes.setdefault(cls, []).append(method)
 
     def register_method(self, event_type: int) -> Callable:
         """
@@ -109,12 +143,23 @@ class EventManager(BaseManager):
         :raises KeyError: If cls is not contained in the class listeners, this
         error will be raised.
         """
-        # Purge instances
-        self._class_listener_instances.pop(cls, None)
-        # Remove methods from events
-        for method in self._assigned_classes.get(cls, []):
-            self.deregister_method(method)
-        self._assigned_classes.pop(cls)
+        with self._lock:
+            # Purge instances
+            self._class_listener_instances.pop(cls, None)
+            # Remove methods from events, using the reverse indexes so only the
+            # events the class actually listens to are touched.
+            for method in dict.fromkeys(self._assigned_classes.pop(cls)):
+                event_types = self._class_listener_events.pop(method, ())
+                self._remove_class_listener(method, event_types, cls)
+                # The method may still be listening on behalf of another class,
+                # such as a subclass that inherited it.
+                remaining = [
+                    event_type
+                    for event_type in event_types
+                    if self._is_class_listener(method, event_type)
+                ]
+                if remaining:
+                    self._class_listener_events[method] = remaining
 
     def deregister_method(self, method: Callable):
         """
@@ -123,15 +168,75 @@ class EventManager(BaseManager):
 
         :param method: Method whose registration is being revoked.
         """
-        for (event_type, is_concurrent), listener_set in self._class_listeners.items():
-            listener_set = list(
-                filter(
-                    lambda call_list: method is not call_list[0],
-                    listener_set,
-                )
+        with self._lock:
+            event_types = self._class_listener_events.pop(method, ())
+            self._remove_class_listener(method, event_types)
+
+    def _remove_class_listener(
+        self,
+        method: Callable,
+        event_types: Sequence[int],
+        cls: Optional[Type[object]] = None,
+    ) -> None:
+        """
+        Removes the method from the class listeners of the given events.
+
+        :param method: Method being removed
+        :param event_types: Pygame events the method is registered to
+        :param cls: Class the method is removed for, defaults to None, which removes
+        it for all classes.
+        """
+        for event_type in dict.fromkeys(event_types):
+            for is_concurrent in (True, False):
+                listeners = self._class_listeners.get((event_type, is_concurrent))
+                if not listeners:
+                    continue
+                listeners[:] = [
+                    (listener, owner)
+                    for listener, owner in listeners
+                    if listener is not method or (cls is not None and owner is not cls)
+                ]
+            self._callables_cache.pop(event_type, None)
+            self._untrack_event(event_type)
+
+    def _track_event(self, event_type: int) -> None:
+        """
+        Marks the manager as having listeners for the event, so notifyEventManagers
+        passes it on while the manager is in handlers.
+
+        :param event_type: Pygame event type
+        """
+        managers = self._managers_by_event.get(event_type)
+        if managers is None:
+            managers = self._managers_by_event.setdefault(
+                event_type, WeakKeyDictionary()
             )
-            self._class_listeners.update({(event_type, is_concurrent): listener_set})
-        self._class_listener_events.pop(method)
+        managers[self] = None
+
+    def _untrack_event(self, event_type: int) -> None:
+        """
+        Stops notifyEventManagers passing the event on to the manager, once the
+        manager has no listeners left for it.
+
+        :param event_type: Pygame event type
+        """
+        for is_concurrent in (True, False):
+            if self._listeners.get((event_type, is_concurrent)):
+                return
+            if self._class_listeners.get((event_type, is_concurrent)):
+                return
+        managers = self._managers_by_event.get(event_type)
+        if managers:
+            managers.pop(self, None)
+
+    def _is_class_listener(self, method: Callable, event_type: int) -> bool:
+        return any(
+            listener is method
+            for is_concurrent in (True, False)
+            for listener, _ in self._class_listeners.get(
+                (event_type, is_concurrent), ()
+            )
+        )
 
     def purge_event(self, event_type: int) -> None:
         """
@@ -139,41 +244,78 @@ class EventManager(BaseManager):
 
         :param event_type: Pygame event type
         """
-        to_remove: list[tuple[int, bool]] = []
-        for event, is_concurrent in self._listeners.keys():
-            if event == event_type:
-                to_remove.append((event, is_concurrent))
-        for key in to_remove:
-            # Not including default value since the keys came directly from the
-            # dictionary and shouldn't be absent
-            # If this errors, it suggests another process is deleting the key first,
-            # which could be causing other issues.
-            self._listeners.pop(key, None)
-
-        to_remove = []
-        for event, is_concurrent in self._class_listeners.keys():
-            if event == event_type:
-                to_remove.append((event, is_concurrent))
-        for key in to_remove:
-            self._class_listeners.pop(key, None)
+        with self._lock:
+            to_remove: list[tuple[int, bool]] = []
+            for event, is_concurrent in self._listeners.keys():
+                if event == event_type:
+                    to_remove.append((event, is_concurrent))
+            for key in to_remove:
+                # Not including default value since the keys came directly from the
+                # dictionary and shouldn't be absent
+                # If this errors, it suggests another process is deleting the key
+                # first, which could be causing other issues.
+                for listener in self._listeners.pop(key, ()):
+                    listener_keys = self._listener_keys.get(listener)
+                    if listener_keys is None:
+                        continue
+                    if key in listener_keys:
+                        listener_keys.remove(key)
+                    if not listener_keys:
+                        self._listener_keys.pop(listener)
+
+            to_remove = []
+            for event, is_concurrent in self._class_listeners.keys():
+                if event == event_type:
+                    to_remove.append((event, is_concurrent))
+            for key in to_remove:
+                self._class_listeners.pop(key, None)
+
+            self._callables_cache.pop(event_type, None)
+            self._untrack_event(event_type)
 
     def _get_callables(self, event) -> _CallableSets:
+        event_type = event.type
+        callables = self._callables_cache.get(event_type)
+        if callables is None:
+            with self._lock:
+                callables = self._build_callables(event_type)
+                self._callables_cache[event_type] = callables
+        return callables
+
+    def _build_callables(self, event_type: int) -> _CallableSets:
+        """
+        Collects snapshots of the listeners for the event type, so they can be cached
+        and iterated while the registries change. Must be called while holding the
+        lock.
+
+        :param event_type: Pygame event type
+        :return: The callables assigned to the event type
+        """
         return _CallableSets(
-            concurrent_functions=self._listeners.get((event.type, True), []),
-            sequential_functions=self._listeners.get((event.type, False), []),
-            concurrent_methods=self._class_listeners.get((event.type, True), []),
-            sequential_methods=self._class_listeners.get((event.type, False), []),
+            concurrent_functions=tuple(self._listeners.get((event_type, True), ())),
+            sequential_functions=tuple(self._listeners.get((event_type, False), ())),
+            concurrent_methods=_group_methods(
+                self._class_listeners.get((event_type, True), ())
+            ),
+            sequential_methods=_group_methods(
+                self._class_listeners.get((event_type, False), ())
+            ),
         )
 
 
 def notifyEventManagers(event: pygame.Event) -> None:
     """
-    Passes on the event to all existing EventManagers.
+    Passes on the event to all EventManagers in handlers that have listeners for it.
 
     :param event: Pygame-generated event that is being handled.
     """
-    for event_handler in EventManager.handlers.values():
-        event_handler.notify(event)
+    managers = EventManager._managers_by_event.get(event.type)
+    if not managers:
+        return
+    handlers = EventManager.handlers
+    for event_handler in tuple(managers):
+        if handlers.get(event_handler.handle) is event_handler:
+            event_handler.notify(event)
 
 
 def getEventManager(handle: str) -> EventManager:
@@ -183,4 +325,10 @@ def getEventManager(handle: str) -> EventManager:
 
     :param handle: A string for identifying an event manager instance.
     """
-    return EventManager.handlers.setdefault(handle, EventManager(handle))
+    manager = EventManager.handlers.get(handle)
+    if manager is None:
+        # Only build a new instance when the handle is new, rather than on every
+        # lookup.
+        handle = sys.intern(handle)
+        manager = EventManager.handlers.setdefault(handle, EventManager(handle))
+    return manager
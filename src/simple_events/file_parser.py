@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+import functools
 import json
 import pathlib
+import sys
 from typing import TextIO, Type
 
 from .key_map import KeyMap, KeyBind
@@ -10,6 +12,31 @@ from .joy_map import JoyMap
 
 import pygame
 
+try:
+    # orjson is considerably faster, but is not required.
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+
+def _loads(data: str) -> dict:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(data: dict) -> str:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+@functools.lru_cache(maxsize=None)
+def _key_code(key_name: str | None) -> int | None:
+    if key_name is None:
+        return None
+    return pygame.key.key_code(key_name)
+
 
 def _get_parser_from_path(path: pathlib.Path) -> Type[FileParser]:
     file_type = path.suffix
@@ -54,7 +81,7 @@ class JSONParser(FileParser):
         :param in_file: Target file with the required data.
         :return: Created KeyMap and JoyMap
         """
-        maps: dict = json.load(in_file)
+        maps: dict = _loads(in_file.read())
         key_map = KeyMap()
         key_map.key_binds = JSONParser._unpack_keys(maps.get("keys", {}))
         joy_map = JoyMap()
@@ -72,7 +99,7 @@ class JSONParser(FileParser):
         bind_keys = key_map.pack_binds()
         bind_joysticks = joy_map.pack_binds()
         maps = {"keys": bind_keys, "controller": bind_joysticks}
-        json.dump(maps, out_file, indent=2)
+        out_file.write(_dumps(maps))
 
     @staticmethod
     def _unpack_keys(maps: dict) -> dict:
@@ -83,14 +110,10 @@ class JSONParser(FileParser):
         :return: Dictionary compatible with KeyMap
         """
         unpacked_dict: dict[int | None, list[KeyBind]] = {}
-        for bind_name, key_data in maps.items():
-            key_name, mod = key_data
-            key_code = None
-            if key_name is not None:
-                key_code = pygame.key.key_code(key_name)
-            unpacked_dict.setdefault(key_code, []).append(KeyBind(bind_name, mod))
-            # binds = [KeyBind(bind_name=bind[0], mod=bind[1]) for bind in bind_list]
-            # unpacked_dict.update({key_code: binds})
+        for bind_name, (key_name, mod) in maps.items():
+            unpacked_dict.setdefault(_key_code(key_name), []).append(
+                KeyBind(sys.intern(bind_name), mod)
+            )
         return unpacked_dict
 
     @staticmethod
@@ -107,6 +130,6 @@ class JSONParser(FileParser):
             for data_point in joy_data:
                 joy_data_points.append((data_point[0], data_point[1]))
             fixed_joy_data: tuple = tuple(joy_data_points)
-            unpacked_dict.setdefault(fixed_joy_data, []).append(bind_name)
+            unpacked_dict.setdefault(fixed_joy_data, []).append(sys.intern(bind_name))
 
         return unpacked_dict
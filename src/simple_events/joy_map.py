@@ -1,10 +1,9 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Any, Optional, overload
+from typing import Any, Container, Optional, overload, Sequence
 
 import pygame
 
-
 # These are the types of event data we don't care about
 # 'value' is a read out value, and typically analog, so we don't want that captured
 # 'instance_id" is the specific joystick instace, we want to call regardless of that
@@ -55,7 +54,9 @@ class JoyMap:
     def _convert_pairs(self, event_key: tuple[tuple]) -> dict:
         return dict((key, value) for key, value in event_key)
 
-    def get(self, event: pygame.Event, default: Optional[list] = None) -> list[str]:
+    def get(
+        self, event: pygame.Event, default: Optional[Sequence[str]] = None
+    ) -> Sequence[str]:
         """
         Returns the list of bind names that match the given event.
 
@@ -92,21 +93,37 @@ class JoyMap:
         try:
             self.get_bound_joystick_event(bind_name)
         except ValueError:
-            self._joy_binds.setdefault(
-                # adds the bind to joy_binds, under the given parameters
+            # adds the bind to joy_binds, under the given parameters
+            self._add_binds(
                 (
                     self._convert_event(default_joystick_data)
                     if default_joystick_data is not None
                     else None
                 ),
-                [],
-            ).append(bind_name)
+                [bind_name],
+            )
+
+    def _add_binds(self, key: tuple[tuple] | None, bind_names: list[str]) -> None:
+        # As with KeyMap, lists are replaced rather than changed in place so they can
+        # be read safely from other threads.
+        self._joy_binds[key] = [*self._joy_binds.get(key, ()), *bind_names]
+
+    def _strip_binds(self, bind_names: Container[str]) -> None:
+        dead_keys = []
+        for key, bind_list in self._joy_binds.items():
+            remaining = [bind for bind in bind_list if bind not in bind_names]
+            if len(remaining) != len(bind_list):
+                self._joy_binds[key] = remaining
+            if not remaining:
+                dead_keys.append(key)
+        for key in dead_keys:
+            self._joy_binds.pop(key)
 
     def _rebind(
         self, bind_name: str, new_joystick_data: Optional[tuple[tuple]] = None
     ) -> None:
         self.remove_bind(bind_name)
-        self._joy_binds.setdefault(new_joystick_data, []).append(bind_name)
+        self._add_binds(new_joystick_data, [bind_name])
 
     def rebind(self, bind_name: str, new_joystick_data: Optional[dict] = None):
         """
@@ -131,14 +148,7 @@ class JoyMap:
 
         :param bind_name: Name of the target bind
         """
-        dead_keys = []
-        for key, bind_list in self._joy_binds.items():
-            if bind_name in bind_list:
-                bind_list.remove(bind_name)
-            if len(bind_list) == 0:
-                dead_keys.append(key)
-        for key in dead_keys:
-            self._joy_binds.pop(key)
+        self._strip_binds({bind_name})
 
     def merge(self, other: JoyMap) -> None:
         """
@@ -147,9 +157,20 @@ class JoyMap:
 
         :param other: A JoyMap with preferred binds.
         """
-        for joy_data, bind_list in other._joy_binds.items():
-            for bind in bind_list:
-                self._rebind(bind, joy_data)
+        incoming: dict[str, tuple[tuple] | None] = {
+            bind: joy_data
+            for joy_data, bind_list in other._joy_binds.items()
+            for bind in bind_list
+        }
+        if not incoming:
+            return
+        self._strip_binds(incoming)
+
+        grouped: dict[tuple[tuple] | None, list[str]] = {}
+        for bind, joy_data in incoming.items():
+            grouped.setdefault(joy_data, []).append(bind)
+        for joy_data, bind_list in grouped.items():
+            self._add_binds(joy_data, bind_list)
 
     def pack_binds(self) -> dict:
         """
@@ -159,6 +180,6 @@ class JoyMap:
         packed_dict: dict[str, tuple[tuple] | None] = {}
         for joy_data, bind_list in self._joy_binds.items():
             for bind in bind_list:
-                packed_dict.update({bind: joy_data})
+                packed_dict[bind] = joy_data
 
         return packed_dict
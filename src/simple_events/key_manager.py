@@ -1,24 +1,30 @@
 from __future__ import annotations
 
-import itertools
 import logging
 from os import PathLike
 from pathlib import Path
-from typing import Any, Callable, Optional, overload, Type
+import sys
+from typing import Any, Callable, Optional, overload, Sequence, Type
 
 # import file_parser
 from .file_parser import FileParser, _get_parser_from_path
 from .joy_map import JoyMap
 from .key_map import KeyBind, KeyMap
-from .base_manager import BaseManager, _CallableSets
+from .base_manager import BaseManager, _CallableSets, _group_methods
 
 import pygame
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Shared result for events with no listeners. Callables sets are never modified.
+_NO_CALLABLES = _CallableSets()
+
 
 class KeyListener(BaseManager):
     _listeners: dict[str, KeyListener] = {}
+    # Snapshot of _listeners' values for broadcasting, rebuilt when one is added, or
+    # when _listeners has been changed directly and no longer matches its size.
+    _listener_snapshot: tuple[KeyListener, ...] = ()
     key_map: KeyMap = KeyMap()
     joy_map: JoyMap = JoyMap()
 
@@ -26,7 +32,12 @@ class KeyListener(BaseManager):
         super().__init__(handle)
 
         # --------Basic function assignment--------
-        self._key_hooks: dict[tuple[str, bool, int], list[Callable]] = {}
+        # Responders are held as dict keys for ordered, constant time membership
+        self._key_hooks: dict[tuple[str, bool, int], dict[Callable, None]] = {}
+        # Inversion of _key_hooks. Function as key, hook keys as values
+        self._key_hook_keys: dict[Callable, list[tuple[str, bool, int]]] = {}
+        # Pygame events anything has been bound to, for filtering out the rest
+        self._bound_event_types: set[int] = set()
 
         # --------Class method assignment--------
         self._class_listeners: dict[
@@ -35,6 +46,12 @@ class KeyListener(BaseManager):
         # Inversion of _class_listeners. Method as key, bind name
         self._class_listener_binds: dict[Callable, list[str]] = {}
 
+        # --------Dispatch cache--------
+        # Bind name and pygame event as key, prebuilt callables for that bind as values
+        # Cleared whenever the listeners change. Binds are resolved from the key and
+        # joy maps on every event, so those may change freely.
+        self._callables_cache: dict[tuple[str, int], _CallableSets] = {}
+
     @overload
     def bind(
         self,
@@ -128,6 +145,9 @@ class KeyListener(BaseManager):
         """
 
     def bind(self, key_bind_name: str, *args, **kwds) -> Callable:
+        # Bind names key the hook registries and the dispatch cache, so interning
+        # them lets those lookups match by identity.
+        key_bind_name = sys.intern(key_bind_name)
         event_type: int
         is_stick = False
         default_key: Optional[int] = kwds.get("default_key", None)
@@ -161,11 +181,14 @@ class KeyListener(BaseManager):
         def decorator(responder: Callable) -> Callable:
             # Regardless, add the responder to the bind within our hook dict
             is_concurrent = not hasattr(responder, "_runs_sequential")
-            event_list = self._key_hooks.setdefault(
-                (key_bind_name, is_concurrent, event_type), []
-            )
-            if responder not in event_list:
-                event_list.append(responder)
+            hook_key = (key_bind_name, is_concurrent, event_type)
+            with self._lock:
+                event_set = self._key_hooks.setdefault(hook_key, {})
+                if responder not in event_set:
+                    event_set[responder] = None
+                    self._key_hook_keys.setdefault(responder, []).append(hook_key)
+                self._bound_event_types.add(event_type)
+                self._callables_cache.clear()
             return responder
 
         return decorator
@@ -210,12 +233,16 @@ class KeyListener(BaseManager):
         *args,
         **kwds,
     ) -> dict | tuple[int | None, int | None] | None:
+        # The new KeyBind replaces the one made by bind, so keep its name interned
+        key_bind_name = sys.intern(key_bind_name)
         new_bind: Any
         if len(args):
             new_bind = args[0]
-        elif new_bind := kwds.get("new_key"):
-            pass
-        if kwds.get("new_joystick_data") or isinstance(new_bind, dict):
+        elif "new_joystick_data" in kwds:
+            new_bind = kwds["new_joystick_data"]
+        else:
+            new_bind = kwds.get("new_key", None)
+        if "new_joystick_data" in kwds or isinstance(new_bind, dict):
             return self._rebind_joystick(key_bind_name, new_bind)
         else:
             mod_keys: int | None
@@ -236,9 +263,10 @@ class KeyListener(BaseManager):
             old_bind = self.key_map.get_bound_key(key_bind_name)
         except ValueError:
             logger.warning(
-                f"Attempted to rebind '{key_bind_name}' when bind does not"
-                " exist. \n Program might be attempting to rebind before"
-                " generating binds, or bind name may be incorrect."
+                "Attempted to rebind '%s' when bind does not exist. \n Program might"
+                " be attempting to rebind before generating binds, or bind name may"
+                " be incorrect.",
+                key_bind_name,
             )
             return None
         self.key_map.rebind(
@@ -257,9 +285,10 @@ class KeyListener(BaseManager):
             old_bind = self.joy_map.get_bound_joystick_event(key_bind_name)
         except ValueError:
             logger.warning(
-                f"Attempted to rebind '{key_bind_name}' when bind does not"
-                " exist. \n Program might be attempting to rebind before"
-                " generating binds, or bind name may be incorrect."
+                "Attempted to rebind '%s' when bind does not exist. \n Program might"
+                " be attempting to rebind before generating binds, or bind name may"
+                " be incorrect.",
+                key_bind_name,
             )
             return None
         self.joy_map.rebind(key_bind_name, new_joystick_data)
@@ -275,12 +304,19 @@ class KeyListener(BaseManager):
         :param bind_name: The bind to be removed from, or all instances, if
         None. Defaults to None.
         """
-        # Greatly simplified
-        for (name, _, _), call_list in self._key_hooks.items():
-            if bind_name is not None and name != bind_name:
-                continue
-            if func in call_list:
-                call_list.remove(func)
+        with self._lock:
+            hook_keys = self._key_hook_keys.pop(func, ())
+            remaining: list[tuple[str, bool, int]] = []
+            for hook_key in hook_keys:
+                if bind_name is not None and hook_key[0] != bind_name:
+                    remaining.append(hook_key)
+                    continue
+                call_set = self._key_hooks.get(hook_key)
+                if call_set:
+                    call_set.pop(func, None)
+            if remaining:
+                self._key_hook_keys[func] = remaining
+            self._callables_cache.clear()
 
     def _capture_method(
         self, cls: Type[object], method: Callable, tag_data: tuple
@@ -305,18 +341,21 @@ class KeyListener(BaseManager):
         else:
             self.key_map.generate_bind(key_bind_name, default_key, default_mod)
 
-        # -----Add to Class Listeners-----
-        listeners = self._class_listeners.setdefault(
-            (key_bind_name, is_concurrent, event_type), []
-        )
-        listeners.append((method, cls))
+        with self._lock:
+            # -----Add to Class Listeners-----
+            listeners = self._class_listeners.setdefault(
+                (key_bind_name, is_concurrent, event_type), []
+            )
+            listeners.append((method, cls))
+            self._bound_event_types.add(event_type)
+            self._callables_cache.clear()
 
-        # -----Add to Class Listener Events-----
+            # -----Add to Class Listener Events-----
 
-        self._class_listener_binds.setdefault(method, []).append(key_bind_name)
+            self._class_listener_binds.setdefault(method, []).append(key_bind_name)
 
-        # -----Add to Assigned Classes-----
-        self._assigned_classes.setdefault(cls, []).append(method)
+            # -----Add to Assigned Classes-----
+            self._assigned_classes.setdefault(cls, []).append(method)
 
     def bind_method(
         self,
@@ -340,7 +379,7 @@ class KeyListener(BaseManager):
             return self._tag_method(
                 method,
                 (
-                    key_bind_name,
+                    sys.intern(key_bind_name),
                     default_key,
                     default_mod,
                     event_type,
@@ -358,10 +397,20 @@ class KeyListener(BaseManager):
         :raises KeyError: If cls is not contained in the class listeners, this
         error will be raised.
         """
-        self._class_listener_instances.pop(cls, None)
-        for method in self._assigned_classes.get(cls, []):
-            self.unbind_method(method)
-        self._assigned_classes.pop(cls)
+        with self._lock:
+            self._class_listener_instances.pop(cls, None)
+            for method in dict.fromkeys(self._assigned_classes.pop(cls)):
+                bind_names = self._class_listener_binds.pop(method, ())
+                self._remove_class_listener(method, bind_names, cls)
+                # The method may still be bound on behalf of another class, such as
+                # a sibling subclass that inherited it.
+                remaining = [
+                    bind_name
+                    for bind_name in bind_names
+                    if self._is_class_listener(method, bind_name)
+                ]
+                if remaining:
+                    self._class_listener_binds[method] = remaining
 
     def unbind_method(self, method: Callable):
         """
@@ -369,21 +418,43 @@ class KeyListener(BaseManager):
 
         :param method: Method being unbound
         """
-        for (
-            name,
-            is_concurrent,
-            event_type,
-        ), listener_set in self._class_listeners.items():
-            listener_set = list(
-                filter(
-                    lambda call_list: method is not call_list[0],
-                    listener_set,
-                )
-            )
-            self._class_listeners.update(
-                {(name, is_concurrent, event_type): listener_set}
-            )
-        self._class_listener_binds.pop(method)
+        with self._lock:
+            bind_names = self._class_listener_binds.pop(method, ())
+            self._remove_class_listener(method, bind_names)
+
+    def _remove_class_listener(
+        self,
+        method: Callable,
+        bind_names: Sequence[str],
+        cls: Optional[Type[object]] = None,
+    ) -> None:
+        """
+        Removes the method from the class listeners of the given binds.
+
+        :param method: Method being removed
+        :param bind_names: Binds the method is captured for
+        :param cls: Class the method is removed for, defaults to None, which removes
+        it for all classes.
+        """
+        # Only the binds the method was captured for need filtering
+        bind_name_set = set(bind_names)
+        for key, listener_set in self._class_listeners.items():
+            if key[0] not in bind_name_set:
+                continue
+            listener_set[:] = [
+                (listener, owner)
+                for listener, owner in listener_set
+                if listener is not method or (cls is not None and owner is not cls)
+            ]
+        self._callables_cache.clear()
+
+    def _is_class_listener(self, method: Callable, bind_name: str) -> bool:
+        return any(
+            listener is method
+            for key, listener_set in self._class_listeners.items()
+            if key[0] == bind_name
+            for listener, _ in listener_set
+        )
 
     def clear_bind(self, bind_name: str, eliminate_bind: bool = False) -> None:
         """
@@ -393,89 +464,132 @@ class KeyListener(BaseManager):
         :param eliminate_bind: Boolean for determining if the bind should be removed
         from the JoyMap and KeyMap, defaults to False
         """
-        to_delete: list[tuple[str, bool, int]] = []
-        for name, is_concurrent, event_type in self._key_hooks.keys():
-            if name == bind_name:
-                to_delete.append((name, is_concurrent, event_type))
-        for key in to_delete:
-            # Not including default value since the keys came directly from the
-            # dictionary and shouldn't be absent
-            # If this errors, it suggests another process is deleting the key first,
-            # which could be causing other issues.
-            self._key_hooks.pop(key)
-
-        # Repeat for class listeners
-        to_delete = []
-        for name, is_concurrent, event_type in self._class_listeners.keys():
-            if name == bind_name:
-                to_delete.append((name, is_concurrent, event_type))
-        for key in to_delete:
-            self._class_listeners.pop(key)
+        with self._lock:
+            to_delete: list[tuple[str, bool, int]] = []
+            for name, is_concurrent, event_type in self._key_hooks.keys():
+                if name == bind_name:
+                    to_delete.append((name, is_concurrent, event_type))
+            for key in to_delete:
+                # Not including default value since the keys came directly from the
+                # dictionary and shouldn't be absent
+                # If this errors, it suggests another process is deleting the key
+                # first, which could be causing other issues.
+                for responder in self._key_hooks.pop(key):
+                    hook_keys = self._key_hook_keys.get(responder)
+                    if hook_keys is None:
+                        continue
+                    if key in hook_keys:
+                        hook_keys.remove(key)
+                    if not hook_keys:
+                        self._key_hook_keys.pop(responder)
+
+            # Repeat for class listeners
+            to_delete = []
+            for name, is_concurrent, event_type in self._class_listeners.keys():
+                if name == bind_name:
+                    to_delete.append((name, is_concurrent, event_type))
+            for key in to_delete:
+                self._class_listeners.pop(key)
+            self._callables_cache.clear()
 
         if eliminate_bind:
             self.key_map.remove_bind(bind_name)
             self.joy_map.remove_bind(bind_name)
 
-    def _validate_input(self, key_bind: KeyBind, event: pygame.Event) -> bool:
-        """
-        Validates the input data against a key bind to ensure a match
-
-        :param key_bind: Target key bind containing desired input data
-        :param input_data: Data coming from the recent input event
-        :return: True if the input data matches the bind, otherwise false
-        """
-        is_valid = False
-        # This structure is here to potentially leave room for
-        key_changed: int | None = getattr(event, "key", None)
-        mod_keys: int | None = getattr(event, "mod", None)
-        if key_changed is not None:
-            mod = key_bind.mod
-            if mod is None:
-                is_valid = True
-            elif mod_keys is not None and (mod & mod_keys or mod is mod_keys):
-                # mod is mod_keys catches pygame.KMOD_NONE
-                is_valid = True
-
-        return is_valid
-
     def _get_callables(self, event: pygame.Event) -> _CallableSets:
         """
         Calls all registered functions and methods that make use of the given event
 
         :param event: pygame event to be passed to the callables
         """
+        event_type = event.type
+        if event_type not in self._bound_event_types:
+            # Nothing listens for this kind of event, such as mouse motion, so skip
+            # resolving binds for it entirely.
+            return _NO_CALLABLES
+
         key_changed: int | None = getattr(event, "key", None)
 
-        binds: list[str] = []
+        binds: Sequence[str]
         if key_changed is not None:
-            binds = [
-                key_bind.bind_name
-                for key_bind in self.key_map.key_binds.get(key_changed, [])
-                if self._validate_input(key_bind, event)
-            ]
+            key_binds = self.key_map.key_binds.get(key_changed)
+            if not key_binds:
+                return _NO_CALLABLES
+            mod_keys: int | None = getattr(event, "mod", None)
+            # Binds without mod keys always match. Otherwise any shared mod key
+            # matches, and equality catches pygame.KMOD_NONE.
+            if mod_keys is None:
+                binds = [
+                    key_bind.bind_name for key_bind in key_binds if key_bind.mod is None
+                ]
+            else:
+                binds = [
+                    key_bind.bind_name
+                    for key_bind in key_binds
+                    if key_bind.mod is None
+                    or key_bind.mod & mod_keys
+                    or key_bind.mod == mod_keys
+                ]
         else:
-            if event.type == pygame.JOYBUTTONDOWN:
-                print(event.button)
-            binds = self.joy_map.get(event, [])
-        conc_funcs_lists = []
-        seq_funcs_lists = []
-        conc_methods_lists = []
-        seq_methods_lists = []
+            binds = self.joy_map.get(event, ())
+        if not binds:
+            return _NO_CALLABLES
+
+        if len(binds) == 1:
+            # By far the most common case, which can be handed out as-is
+            return self._get_bind_callables(binds[0], event_type)
+
+        concurrent_functions: list[Callable] = []
+        sequential_functions: list[Callable] = []
+        concurrent_methods: dict[Type[object], list[Callable]] = {}
+        sequential_methods: dict[Type[object], list[Callable]] = {}
         for bind in binds:
-            conc_funcs_lists.append(self._key_hooks.get((bind, True, event.type), []))
-            seq_funcs_lists.append(self._key_hooks.get((bind, False, event.type), []))
+            callables = self._get_bind_callables(bind, event_type)
+            concurrent_functions.extend(callables.concurrent_functions)
+            sequential_functions.extend(callables.sequential_functions)
+            for cls, methods in callables.concurrent_methods.items():
+                concurrent_methods.setdefault(cls, []).extend(methods)
+            for cls, methods in callables.sequential_methods.items():
+                sequential_methods.setdefault(cls, []).extend(methods)
+        return _CallableSets(
+            concurrent_functions=concurrent_functions,
+            sequential_functions=sequential_functions,
+            concurrent_methods=concurrent_methods,
+            sequential_methods=sequential_methods,
+        )
 
-            conc_methods_lists.append(
-                self._class_listeners.get((bind, True, event.type), [])
-            )
-            seq_methods_lists.append(
-                self._class_listeners.get((bind, False, event.type), [])
-            )
+    def _get_bind_callables(self, bind_name: str, event_type: int) -> _CallableSets:
+        key = (bind_name, event_type)
+        callables = self._callables_cache.get(key)
+        if callables is None:
+            with self._lock:
+                callables = self._build_callables(bind_name, event_type)
+                self._callables_cache[key] = callables
+        return callables
+
+    def _build_callables(self, bind_name: str, event_type: int) -> _CallableSets:
+        """
+        Collects snapshots of the listeners for the bind and event type, so they can
+        be cached and iterated while the registries change. Must be called while
+        holding the lock.
+
+        :param bind_name: Name of the bind triggered by the event
+        :param event_type: Pygame event type
+        :return: The callables assigned to the bind and event type
+        """
         return _CallableSets(
-            concurrent_functions=list(itertools.chain(*conc_funcs_lists)),
-            sequential_functions=list(itertools.chain(*seq_funcs_lists)),
-            concurrent_methods=list(itertools.chain(*conc_methods_lists)),
-            sequential_methods=list(itertools.chain(*seq_methods_lists)),
+            concurrent_functions=tuple(
+                self._key_hooks.get((bind_name, True, event_type), ())
+            ),
+            sequential_functions=tuple(
+                self._key_hooks.get((bind_name, False, event_type), ())
+            ),
+            concurrent_methods=_group_methods(
+                self._class_listeners.get((bind_name, True, event_type), ())
+            ),
+            sequential_methods=_group_methods(
+                self._class_listeners.get((bind_name, False, event_type), ())
+            ),
         )
 
     @classmethod
@@ -534,7 +648,12 @@ def notifyKeyListeners(event: pygame.Event) -> None:
 
     :param event: Pygame event instance, of type KEYDOWN or KEYUP
     """
-    for listener in KeyListener._listeners.values():
+    listeners = KeyListener._listener_snapshot
+    if len(listeners) != len(KeyListener._listeners):
+        listeners = KeyListener._listener_snapshot = tuple(
+            KeyListener._listeners.values()
+        )
+    for listener in listeners:
         listener.notify(event)
 
 
@@ -545,4 +664,11 @@ def getKeyListener(handle: str) -> KeyListener:
 
     :param handle: String describing the KeyListener.
     """
-    return KeyListener._listeners.setdefault(handle, KeyListener(handle))
+    manager = KeyListener._listeners.get(handle)
+    if manager is None:
+        # Only build a new instance when the handle is new, rather than on every
+        # lookup.
+        handle = sys.intern(handle)
+        manager = KeyListener._listeners.setdefault(handle, KeyListener(handle))
+        KeyListener._listener_snapshot = tuple(KeyListener._listeners.values())
+    return manager
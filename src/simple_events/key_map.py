@@ -1,7 +1,8 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
+import functools
 import logging
-from typing import NamedTuple, Optional
+from typing import Container, NamedTuple, Optional
 
 import pygame
 
@@ -10,6 +11,11 @@ logger: logging.Logger = logging.getLogger(__name__)
 KeyBind = NamedTuple("KeyBind", [("bind_name", str), ("mod", int | None)])
 
 
+@functools.lru_cache(maxsize=None)
+def _key_name(key: int) -> str:
+    return pygame.key.name(key)
+
+
 @dataclass
 class KeyMap:
     """
@@ -17,6 +23,12 @@ class KeyMap:
     """
 
     key_binds: dict[int | None, list[KeyBind]] = field(default_factory=dict)
+    # Bind name as key, the key it was last seen under as value
+    # key_binds may be changed directly, so entries are checked before they are
+    # trusted, and rebuilt by a scan when they are missing or stale.
+    _bound_keys: dict[str, int | None] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def rebind(self, new_key_bind: KeyBind, new_key: Optional[int] = None) -> None:
         """
@@ -27,24 +39,93 @@ class KeyMap:
         :param new_key_bind: Keybind containing the bind name and mod keys.
         :param new_key: Pygame key id, defaults to None
         """
-        dead_keys: set[int | None] = set()
+        found = self._find_bind(new_key_bind.bind_name)
+        if found is not None:
+            self._remove_from_key(found[0], new_key_bind.bind_name, drop_empty=True)
+        self._add_binds(new_key, [new_key_bind])
+
+    def _find_bind(self, bind_name: str) -> tuple[int | None, KeyBind] | None:
+        """
+        Finds the key a bind is under, using the index where possible.
+
+        :param bind_name: Name of the bind being searched for
+        :return: The key and the bind, or None if the bind does not exist
+        """
+        key: int | None
+        if bind_name in self._bound_keys:
+            key = self._bound_keys[bind_name]
+            for key_bind in self.key_binds.get(key, ()):
+                if key_bind.bind_name == bind_name:
+                    return key, key_bind
+        # Not indexed yet, or the index is stale
         for key, key_bind_list in self.key_binds.items():
-            binds_to_remove: list[KeyBind] = []
-            key_bind: KeyBind
             for key_bind in key_bind_list:
-                if key_bind.bind_name == new_key_bind.bind_name:
-                    # Can't directly remove in the loop, could skip one.
-                    binds_to_remove.append(key_bind)
-            removed_bind: KeyBind
-            for removed_bind in binds_to_remove:
-                key_bind_list.remove(removed_bind)
-            if not key_bind_list:
-                dead_keys.add(key)
+                if key_bind.bind_name == bind_name:
+                    self._bound_keys[bind_name] = key
+                    return key, key_bind
+        self._bound_keys.pop(bind_name, None)
+        return None
+
+    def _add_binds(self, key: int | None, key_binds: list[KeyBind]) -> None:
+        # Bind lists are replaced rather than changed in place, so a list being read
+        # by a listener on another thread never changes underneath it.
+        self.key_binds[key] = [*self.key_binds.get(key, ()), *key_binds]
+        for key_bind in key_binds:
+            self._bound_keys[key_bind.bind_name] = key
+
+    def _remove_from_key(
+        self, key: int | None, bind_name: str, drop_empty: bool
+    ) -> bool:
+        """
+        Removes the named bind from a single key.
+
+        :param key: Key the bind is removed from
+        :param bind_name: Name of the bind being removed
+        :param drop_empty: Whether the key is removed as well if left without binds
+        :return: True if the bind was removed
+        """
+        key_bind_list = self.key_binds.get(key, ())
+        remaining = [
+            key_bind for key_bind in key_bind_list if key_bind.bind_name != bind_name
+        ]
+        if len(remaining) == len(key_bind_list):
+            return False
+        if remaining or not drop_empty:
+            self.key_binds[key] = remaining
+        else:
+            self.key_binds.pop(key)
+        self._bound_keys.pop(bind_name, None)
+        return True
+
+    def _strip_binds(self, bind_names: Container[str], drop_empty: bool) -> bool:
+        """
+        Removes the named binds from every key.
+
+        :param bind_names: Names of the binds being removed
+        :param drop_empty: Whether keys left without binds are removed as well
+        :return: True if any binds were removed
+        """
+        removed = False
+        dead_keys: list[int | None] = []
+        for key, key_bind_list in self.key_binds.items():
+            remaining = [
+                key_bind
+                for key_bind in key_bind_list
+                if key_bind.bind_name not in bind_names
+            ]
+            if len(remaining) == len(key_bind_list):
+                continue
+            removed = True
+            for key_bind in key_bind_list:
+                if key_bind.bind_name in bind_names:
+                    self._bound_keys.pop(key_bind.bind_name, None)
+            self.key_binds[key] = remaining
+            if not remaining and drop_empty:
+                dead_keys.append(key)
         # Clean up any empty lists
         for key in dead_keys:
             self.key_binds.pop(key)
-
-        self.key_binds.setdefault(new_key, []).append(new_key_bind)
+        return removed
 
     def get_bound_key(self, bind_name: str) -> tuple[int | None, int | None]:
         """
@@ -56,14 +137,11 @@ class KeyMap:
         a pygame key, the second a bitmask int representing pygame mod keys.
         :raises ValueError: Raised if the bind name is not found.
         """
-        key: int | None
-        key_bind_list: list[KeyBind]
-        key_bind: KeyBind
-        for key, key_bind_list in self.key_binds.items():
-            for key_bind in key_bind_list:
-                if key_bind.bind_name == bind_name:
-                    return key, key_bind.mod
-        raise ValueError(f"Bind name: {bind_name} not found.")
+        found = self._find_bind(bind_name)
+        if found is None:
+            raise ValueError(f"Bind name: {bind_name} not found.")
+        key, key_bind = found
+        return key, key_bind.mod
 
     def generate_bind(
         self,
@@ -82,11 +160,11 @@ class KeyMap:
         :param default_mod: bitmask of pygame modkeys for a new bind,
         defaults to pygame.KMOD_NONE
         """
-        try:
-            self.get_bound_key(key_bind_name)
-        except ValueError:
-            self.key_binds.setdefault(default_key, []).append(
-                KeyBind(bind_name=key_bind_name, mod=default_mod)
+        # Checked through the index directly, since binds are regenerated every time
+        # a listener is decorated, and most already exist.
+        if self._find_bind(key_bind_name) is None:
+            self._add_binds(
+                default_key, [KeyBind(bind_name=key_bind_name, mod=default_mod)]
             )
 
     def remove_bind(self, bind_name: str, key: Optional[int] = None) -> None:
@@ -101,30 +179,22 @@ class KeyMap:
         if key is not None:
             key_bind_list = self.key_binds.get(key, None)
             if not key_bind_list:
-                logger.warning(
-                    f" Cannot remove '{bind_name}';"
-                    f" {pygame.key.name(key)} does not have any binds."
-                )
+                if logger.isEnabledFor(logging.WARNING):
+                    logger.warning(
+                        " Cannot remove '%s'; %s does not have any binds.",
+                        bind_name,
+                        _key_name(key),
+                    )
                 return
-            to_remove: list[KeyBind] = []
-            for key_bind in key_bind_list:
-                if key_bind.bind_name == bind_name:
-                    to_remove.append(key_bind)
-            for item in to_remove:
-                key_bind_list.remove(item)
-            if not to_remove:
-                logger.warning(
-                    f" Cannot remove '{bind_name}';"
-                    f" bind does not exist in {pygame.key.name(key)}"
-                )
+            if not self._remove_from_key(key, bind_name, drop_empty=False):
+                if logger.isEnabledFor(logging.WARNING):
+                    logger.warning(
+                        " Cannot remove '%s'; bind does not exist in %s",
+                        bind_name,
+                        _key_name(key),
+                    )
             return
-        for key_bind_list in self.key_binds.values():
-            to_remove = []
-            for key_bind in key_bind_list:
-                if key_bind.bind_name == bind_name:
-                    to_remove.append(key_bind)
-            for item in to_remove:
-                key_bind_list.remove(item)
+        self._strip_binds({bind_name}, drop_empty=False)
         return None
 
     def merge(self, other: KeyMap) -> None:
@@ -135,9 +205,22 @@ class KeyMap:
 
         :param other: Key map to be merged.
         """
-        for key, bind_list in other.key_binds.items():
-            for bind in bind_list:
-                self.rebind(bind, key)
+        incoming: dict[str, tuple[int | None, KeyBind]] = {
+            bind.bind_name: (key, bind)
+            for key, bind_list in other.key_binds.items()
+            for bind in bind_list
+        }
+        if not incoming:
+            return
+        # Pull every incoming bind off its current key in a single pass, rather than
+        # rescanning the whole map for each one.
+        self._strip_binds(incoming, drop_empty=True)
+
+        grouped: dict[int | None, list[KeyBind]] = {}
+        for key, bind in incoming.values():
+            grouped.setdefault(key, []).append(bind)
+        for key, key_bind_list in grouped.items():
+            self._add_binds(key, key_bind_list)
 
     def pack_binds(self) -> dict:
         """
@@ -145,10 +228,10 @@ class KeyMap:
         """
         packed_dict: dict[str, tuple[str | None, int | None]] = {}
         for key_code, bind_list in self.key_binds.items():
+            key_name = None
+            if key_code:
+                key_name = _key_name(key_code)
             for bind in bind_list:
-                key_name = None
-                if key_code:
-                    key_name = pygame.key.name(key_code)
-                packed_dict.update({bind.bind_name: (key_name, bind.mod)})
+                packed_dict[bind.bind_name] = (key_name, bind.mod)
 
         return packed_dict
@@ -1,15 +1,23 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 import pathlib
+import queue
 import sys
 import threading
 from typing import Callable, cast, Type
 import unittest
-from weakref import WeakSet
 
 import pygame
 
 sys.path.append(str(pathlib.Path.cwd()))
 
-from src.simple_events import getEventManager  # noqa: E402
+from src.simple_events import (  # noqa: E402
+    DefaultThreadSystem,
+    getEventManager,
+    notifyEventManagers,
+    pumpEvents,
+)
 from src.simple_events.event_manager import EventManager  # noqa: E402
 
 
@@ -27,6 +35,11 @@ class TestEventManager(unittest.TestCase):
             testBool, msg=f"{obj=} has unexpected attribute, {intendedAttr=}"
         )
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        # The event queue needs pygame initialized, even when not run as a script
+        pygame.init()
+
     def setUp(self) -> None:
         self.event_manager = getEventManager("TestCase")
         self.test_event = pygame.USEREVENT + 1
@@ -34,6 +47,13 @@ class TestEventManager(unittest.TestCase):
 
     def tearDown(self) -> None:
         self.event_manager._listeners.clear()
+        self.event_manager._listener_keys.clear()
+        self.event_manager._callables_cache.clear()
+        EventManager._managers_by_event.clear()
+
+    def test_get_event_manager(self) -> None:
+        self.assertIs(getEventManager("TestCase"), self.event_manager)
+        self.assertIs(EventManager.handlers["TestCase"], self.event_manager)
 
     def test_sequential_tag(self) -> None:
 
@@ -112,6 +132,10 @@ class TestEventManager(unittest.TestCase):
         call_list2 = self.event_manager._listeners.get((self.test_event2, True), [])
 
         self.assertIn(test_func, call_list2)
+        self.assertEqual(
+            self.event_manager._listener_keys.get(test_func),
+            [(self.test_event2, True)],
+        )
 
     def test_deregister_all(self) -> None:
 
@@ -129,6 +153,7 @@ class TestEventManager(unittest.TestCase):
         call_list2 = self.event_manager._listeners.get((self.test_event2, True), [])
 
         self.assertNotIn(test_func, call_list2)
+        self.assertNotIn(test_func, self.event_manager._listener_keys)
 
     def test_register_method(self) -> None:
 
@@ -138,11 +163,11 @@ class TestEventManager(unittest.TestCase):
                 pass
 
         self.assertHasAttr(TestClass.test_method, "_assigned_managers")
-        assigned_managers_pairs: list[tuple[EventManager, int]] = getattr(
+        assigned_managers: dict[EventManager, list[tuple[int]]] = getattr(
             TestClass.test_method, "_assigned_managers"
         )
-        assigned_managers = [pair[0] for pair in assigned_managers_pairs]
         self.assertIn(self.event_manager, assigned_managers)
+        self.assertIn((self.test_event,), assigned_managers[self.event_manager])
 
     def test_register_class(self) -> None:
 
@@ -156,24 +181,143 @@ class TestEventManager(unittest.TestCase):
 
         # Verify attribute cleanup
         self.assertNotHasAttr(TestClass.test_method, "_assigned_managers")
+        # Verify the hijacked init still looks like the original
+        self.assertHasAttr(TestClass.__init__, "__wrapped__")
         # Verify class in assigned classes
-        self.assertIn(TestClass, self.event_manager._assigned_classes.keys())
+        self.assertIn(TestClass, self.event_manager._assigned_classes)
         # Verify method in listeners
-        self.assertIn(
-            TestClass.test_method, self.event_manager._class_listener_events.keys()
-        )
+        self.assertIn(TestClass.test_method, self.event_manager._class_listener_events)
         self.assertIn(
             test_instance,
-            cast(
-                WeakSet[TestClass],
-                self.event_manager._class_listener_instances.get(TestClass),
-            ),
+            list(self.event_manager._class_listener_instances[TestClass].values()),
         )
         listeners = self.event_manager._class_listeners.get((self.test_event, True), [])
         listener_pair = (TestClass.test_method, TestClass)
         # Verify method/object pair are associated with the event
         self.assertIn(listener_pair, listeners)
 
+    def test_register_class_init_arguments(self) -> None:
+
+        @self.event_manager.register_class
+        class TestClass:
+            def __init__(self, instance: int) -> None:
+                self.instance = instance
+
+        # The init's own parameters may share names with the wrapper's
+        test_instance = TestClass(instance=3)
+        self.assertEqual(test_instance.instance, 3)
+        self.assertIn(
+            test_instance,
+            list(self.event_manager._class_listener_instances[TestClass].values()),
+        )
+
+    def test_register_class_multiple_events(self) -> None:
+
+        @self.event_manager.register_class
+        class TestClass:
+            @self.event_manager.register_method(self.test_event)
+            @self.event_manager.register_method(self.test_event2)
+            def test_method(self, _):
+                pass
+
+        # Both events are captured, and the tag is cleaned up afterwards
+        self.assertNotHasAttr(TestClass.test_method, "_assigned_managers")
+        self.assertEqual(
+            sorted(self.event_manager._class_listener_events[TestClass.test_method]),
+            sorted([self.test_event, self.test_event2]),
+        )
+
+    def test_register_class_inherited(self) -> None:
+
+        class BaseClass:
+            @self.event_manager.register_method(self.test_event)
+            def test_method(self, _):
+                pass
+
+        @self.event_manager.register_class
+        class TestClass(BaseClass):
+            pass
+
+        test_instance = TestClass()
+
+        # Left in place, since other subclasses may still be registered
+        self.assertHasAttr(BaseClass.test_method, "_assigned_managers")
+        listeners = self.event_manager._class_listeners.get((self.test_event, True), [])
+        self.assertIn((BaseClass.test_method, TestClass), listeners)
+        self.assertIn(
+            test_instance,
+            list(self.event_manager._class_listener_instances[TestClass].values()),
+        )
+
+    def test_register_class_inherited_base_first(self) -> None:
+
+        calls: list[str] = []
+
+        @self.event_manager.register_class
+        class BaseClass:
+            @self.event_manager.register_method(self.test_event)
+            @self.event_manager.sequential
+            def test_method(self, _):
+                calls.append(type(self).__name__)
+
+        # The base class cleans up the tag, but subclasses still find the method
+        self.assertNotHasAttr(BaseClass.test_method, "_assigned_managers")
+
+        @self.event_manager.register_class
+        class TestClass(BaseClass):
+            pass
+
+        test_instance = BaseClass()  # noqa: F841
+        test_instance2 = TestClass()  # noqa: F841
+
+        self.event_manager.notify(pygame.Event(self.test_event))
+        self.assertEqual(sorted(calls), ["BaseClass", "TestClass"])
+
+    def test_register_class_inherited_siblings(self) -> None:
+
+        calls: list[str] = []
+
+        class BaseClass:
+            @self.event_manager.register_method(self.test_event)
+            @self.event_manager.sequential
+            def test_method(self, _):
+                calls.append(type(self).__name__)
+
+        @self.event_manager.register_class
+        class TestClass(BaseClass):
+            pass
+
+        @self.event_manager.register_class
+        class TestClass2(BaseClass):
+            pass
+
+        test_instance = TestClass()  # noqa: F841
+        test_instance2 = TestClass2()  # noqa: F841
+
+        self.event_manager.notify(pygame.Event(self.test_event))
+        self.assertEqual(sorted(calls), ["TestClass", "TestClass2"])
+
+    def test_register_class_unhashable(self) -> None:
+
+        calls: list[int] = []
+
+        # Dataclasses compare by value and are unhashable by default
+        @self.event_manager.register_class
+        @dataclass
+        class TestClass:
+            value: int
+
+            @self.event_manager.register_method(self.test_event)
+            @self.event_manager.sequential
+            def test_method(self, _):
+                calls.append(self.value)
+
+        test_instance = TestClass(1)  # noqa: F841
+        test_instance2 = TestClass(1)  # noqa: F841
+
+        self.event_manager.notify(pygame.Event(self.test_event))
+        self.assertEqual(calls, [1, 1])
+
     def test_deregister_method(self) -> None:
 
         @self.event_manager.register_class
@@ -188,7 +332,7 @@ class TestEventManager(unittest.TestCase):
 
         # Verify method removed from listeners
         self.assertNotIn(
-            TestClass.test_method, self.event_manager._class_listener_events.keys()
+            TestClass.test_method, self.event_manager._class_listener_events
         )
 
         listeners = self.event_manager._class_listeners.get((self.test_event, True), [])
@@ -211,13 +355,13 @@ class TestEventManager(unittest.TestCase):
 
         self.event_manager.deregister_class(TestClass)
 
-        self.assertNotIn(TestClass, self.event_manager._assigned_classes.keys())
+        self.assertNotIn(TestClass, self.event_manager._assigned_classes)
 
         # Verify method removed from listeners
         self.assertNotIn(
-            TestClass.test_method, self.event_manager._class_listener_events.keys()
+            TestClass.test_method, self.event_manager._class_listener_events
         )
-        self.assertNotIn(TestClass, self.event_manager._class_listener_instances.keys())
+        self.assertNotIn(TestClass, self.event_manager._class_listener_instances)
 
         listeners = self.event_manager._class_listeners.get((self.test_event, True), [])
 
@@ -227,6 +371,39 @@ class TestEventManager(unittest.TestCase):
             listener_pair, cast(list[tuple[Callable, Type[object]]], listeners)
         )
 
+    def test_deregister_class_inherited(self) -> None:
+
+        class BaseClass:
+            @self.event_manager.register_method(self.test_event)
+            @self.event_manager.register_method(self.test_event2)
+            def test_method(self, _):
+                pass
+
+        @self.event_manager.register_class
+        class TestClass(BaseClass):
+            pass
+
+        @self.event_manager.register_class
+        class TestClass2(BaseClass):
+            pass
+
+        self.event_manager.deregister_class(TestClass)
+
+        for event in (self.test_event, self.test_event2):
+            listeners = self.event_manager._class_listeners.get((event, True), [])
+            self.assertNotIn((BaseClass.test_method, TestClass), listeners)
+            self.assertIn((BaseClass.test_method, TestClass2), listeners)
+        self.assertEqual(
+            set(self.event_manager._class_listener_events[BaseClass.test_method]),
+            {self.test_event, self.test_event2},
+        )
+
+        self.event_manager.deregister_class(TestClass2)
+
+        self.assertNotIn(
+            BaseClass.test_method, self.event_manager._class_listener_events
+        )
+
     def test_event_purge(self) -> None:
 
         @self.event_manager.register(self.test_event)
@@ -260,16 +437,12 @@ class TestEventManager(unittest.TestCase):
 
     def test_notify_concurrent(self) -> None:
 
-        example_var = False
+        calls: queue.SimpleQueue[bool] = queue.SimpleQueue()
         example_var2 = False
-        lock = threading.Lock()
 
         @self.event_manager.register(self.test_event)
         def test_func(_) -> None:
-            nonlocal example_var
-            lock.acquire()
-            example_var = True
-            lock.release()
+            calls.put(True)
 
         @self.event_manager.register(self.test_event)
         @self.event_manager.sequential
@@ -278,22 +451,19 @@ class TestEventManager(unittest.TestCase):
             example_var2 = True
 
         local_event = pygame.event.Event(self.test_event2)
-        pygame.event.post(local_event)
-        for event in pygame.event.get():
-            self.event_manager.notify_concurrent(event)
+        self.event_manager.notify_concurrent(local_event)
         # Make sure only the correct event is responded to
-        self.assertFalse(example_var)
+        self.assertTrue(calls.empty())
         self.assertFalse(example_var2)
         local_event = pygame.event.Event(self.test_event)
-        pygame.event.post(local_event)
-        for event in pygame.event.get():
-            self.event_manager.notify_concurrent(event)
-        self.assertTrue(example_var)
+        self.event_manager.notify_concurrent(local_event)
+        # Concurrent functions run on the thread pool, so wait for the call
+        self.assertTrue(calls.get(timeout=1))
         self.assertFalse(example_var2)
 
     def test_notify_class_concurrent(self) -> None:
 
-        lock = threading.Lock()
+        calls: queue.SimpleQueue[object] = queue.SimpleQueue()
 
         @self.event_manager.register_class
         class TestClass:
@@ -307,9 +477,8 @@ class TestEventManager(unittest.TestCase):
 
             @self.event_manager.register_method(self.test_event2)
             def test_method(self, _):
-                lock.acquire()
                 self.test_var = True
-                lock.release()
+                calls.put(self)
 
             @self.event_manager.register_method(self.test_event2)
             @self.event_manager.sequential
@@ -322,35 +491,245 @@ class TestEventManager(unittest.TestCase):
             test_class_list.append(TestClass())
 
         local_event = pygame.Event(self.test_event)
-        pygame.event.post(local_event)
-
-        for event in pygame.event.get():
-            self.event_manager.notify_concurrent(event)
+        self.event_manager.notify_concurrent(local_event)
         for item in test_class_list:
             self.assertFalse(item.test_var)
             self.assertFalse(item.test_var2)
 
         local_event = pygame.Event(self.test_event2)
-        pygame.event.post(local_event)
-
-        for event in pygame.event.get():
-            self.event_manager.notify_concurrent(event)
+        self.event_manager.notify_concurrent(local_event)
+        for _ in test_class_list:
+            self.assertIn(calls.get(timeout=1), test_class_list)
         for item in test_class_list:
             self.assertTrue(item.test_var)
             self.assertFalse(item.test_var2)
 
+    def test_notify_async(self) -> None:
+
+        example_var = False
+        example_var2 = False
+        example_var3 = False
+
+        @self.event_manager.register(self.test_event)
+        async def test_func(_) -> None:
+            nonlocal example_var
+            await asyncio.sleep(0)
+            example_var = True
+
+        @self.event_manager.register(self.test_event)
+        def test_func2(_) -> None:
+            nonlocal example_var2
+            example_var2 = True
+
+        @self.event_manager.register(self.test_event)
+        @self.event_manager.sequential
+        def test_func3(_) -> None:
+            nonlocal example_var3
+            example_var3 = True
+
+        asyncio.run(self.event_manager.notify_async(pygame.Event(self.test_event2)))
+        # Make sure only the correct event is responded to
+        self.assertFalse(example_var)
+        self.assertFalse(example_var2)
+        self.assertFalse(example_var3)
+
+        asyncio.run(self.event_manager.notify_async(pygame.Event(self.test_event)))
+        self.assertTrue(example_var)
+        self.assertTrue(example_var2)
+        self.assertTrue(example_var3)
+
+    def test_notify_async_sequential_error(self) -> None:
+
+        example_var = False
+
+        @self.event_manager.register(self.test_event)
+        async def test_func(_) -> None:
+            nonlocal example_var
+            await asyncio.sleep(0)
+            example_var = True
+
+        @self.event_manager.register(self.test_event)
+        @self.event_manager.sequential
+        def test_func2(_) -> None:
+            raise ValueError
+
+        # The concurrent calls are still awaited before the error is raised
+        with self.assertRaises(ValueError):
+            asyncio.run(self.event_manager.notify_async(pygame.Event(self.test_event)))
+        self.assertTrue(example_var)
+
+    def test_manager_thread_system(self) -> None:
+
+        called = threading.Event()
+        thread_names: list[str] = []
+
+        @self.event_manager.register(self.test_event)
+        def test_func(_) -> None:
+            thread_names.append(threading.current_thread().name)
+            called.set()
+
+        executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="custom")
+        thread_system = DefaultThreadSystem(max_workers=2, executor=executor)
+        self.assertEqual(thread_system.max_workers, 2)
+        # Overrides the shared thread system for this manager only
+        self.event_manager.thread_system = thread_system
+        try:
+            self.event_manager.notify(pygame.Event(self.test_event))
+            self.assertTrue(called.wait(1))
+            self.assertTrue(thread_names[0].startswith("custom"))
+
+            # The executor belongs to the caller, so it survives shutdown
+            self.event_manager.shutdown()
+            executor.submit(lambda: None).result(timeout=1)
+        finally:
+            del self.event_manager.thread_system
+            executor.shutdown()
+
+    def test_manager_shutdown(self) -> None:
+
+        @self.event_manager.register(self.test_event)
+        def test_func(_) -> None:
+            pass
+
+        thread_system = DefaultThreadSystem(max_workers=1)
+        self.event_manager.thread_system = thread_system
+        try:
+            self.event_manager.notify(pygame.Event(self.test_event))
+            self.assertIsNotNone(thread_system._executor)
+            # Shuts down the manager's own pool, rather than the shared one
+            self.event_manager.shutdown()
+            self.assertIsNone(thread_system._executor)
+        finally:
+            del self.event_manager.thread_system
+
+    def test_thread_system_single_pool(self) -> None:
+
+        thread_system = DefaultThreadSystem(max_workers=1)
+        barrier = threading.Barrier(8)
+        executors: list[object] = []
+
+        def get_executor() -> None:
+            barrier.wait()
+            executors.append(thread_system._get_executor())
+
+        threads = [threading.Thread(target=get_executor) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        try:
+            # Threads starting at once all share a single pool
+            self.assertEqual(len({id(executor) for executor in executors}), 1)
+        finally:
+            thread_system.shutdown()
+
+    def test_manager_shutdown_shared(self) -> None:
+
+        thread_system = DefaultThreadSystem(max_workers=1)
+        EventManager.thread_system = thread_system
+        try:
+            thread_system.start_thread(lambda: None)
+            # Without its own thread system, the shared one is left running
+            self.event_manager.shutdown()
+            self.assertIsNotNone(thread_system._executor)
+
+            EventManager.shutdown()
+            self.assertIsNone(thread_system._executor)
+        finally:
+            del EventManager.thread_system
+
+    def test_notify_event_managers_tracking(self) -> None:
+
+        calls: list[str] = []
+        unlisted_manager = EventManager("Unlisted")
+
+        @unlisted_manager.register(self.test_event)
+        @unlisted_manager.sequential
+        def unlisted_func(_) -> None:
+            calls.append("unlisted")
+
+        @self.event_manager.register(self.test_event)
+        @self.event_manager.sequential
+        def test_func(_) -> None:
+            calls.append("listed")
+
+        # Only managers in handlers are passed events
+        notifyEventManagers(pygame.Event(self.test_event))
+        self.assertEqual(calls, ["listed"])
+
+        # Handlers may be changed directly, after listeners are registered
+        EventManager.handlers["Unlisted"] = unlisted_manager
+        try:
+            calls.clear()
+            notifyEventManagers(pygame.Event(self.test_event))
+            self.assertEqual(sorted(calls), ["listed", "unlisted"])
+        finally:
+            EventManager.handlers.pop("Unlisted")
+        calls.clear()
+        notifyEventManagers(pygame.Event(self.test_event))
+        self.assertEqual(calls, ["listed"])
+
+        # The manager is dropped once its last listener for the event is gone
+        self.event_manager.deregister(test_func)
+        self.assertNotIn(
+            self.event_manager, EventManager._managers_by_event.get(self.test_event, {})
+        )
+
+    def test_notify_event_managers(self) -> None:
+
+        example_var = False
+
+        @self.event_manager.register(self.test_event)
+        @self.event_manager.sequential
+        def test_func(_) -> None:
+            nonlocal example_var
+            example_var = True
+
+        self.assertIn(
+            self.event_manager, EventManager._managers_by_event.get(self.test_event, {})
+        )
+
+        notifyEventManagers(pygame.Event(self.test_event2))
+        self.assertFalse(example_var)
+
+        notifyEventManagers(pygame.Event(self.test_event))
+        self.assertTrue(example_var)
+
+    def test_pump_events(self) -> None:
+
+        calls: list[int] = []
+
+        @self.event_manager.register(self.test_event)
+        @self.event_manager.sequential
+        def test_func(event) -> None:
+            calls.append(event.value)
+
+        if not pygame.display.get_init():
+            self.skipTest(
+                "The event queue needs the video system, which failed to start"
+            )
+        # Start from an empty queue, since pygame.init may have posted its own events
+        pygame.event.clear()
+        pygame.event.post(pygame.Event(self.test_event, value=1))
+        pygame.event.post(pygame.Event(self.test_event, value=2))
+
+        events = pumpEvents()
+        self.assertEqual(calls, [1, 2])
+        self.assertEqual(len(events), 2)
+
+        # Nothing left in the queue, so nothing is handled.
+        self.assertEqual(pumpEvents(timeout=1), [])
+        self.assertEqual(calls, [1, 2])
+
     def test_notify_sequential(self) -> None:
 
         example_var = False
         example_var2 = False
-        lock = threading.Lock()
 
         @self.event_manager.register(self.test_event)
         def test_func(_) -> None:
             nonlocal example_var
-            lock.acquire()
             example_var = True
-            lock.release()
 
         @self.event_manager.register(self.test_event)
         @self.event_manager.sequential
@@ -359,23 +738,17 @@ class TestEventManager(unittest.TestCase):
             example_var2 = True
 
         local_event = pygame.event.Event(self.test_event2)
-        pygame.event.post(local_event)
-        for event in pygame.event.get():
-            self.event_manager.notify_sequential(event)
+        self.event_manager.notify_sequential(local_event)
         # Make sure only the correct event is responded to
         self.assertFalse(example_var)
         self.assertFalse(example_var2)
         local_event = pygame.event.Event(self.test_event)
-        pygame.event.post(local_event)
-        for event in pygame.event.get():
-            self.event_manager.notify_sequential(event)
+        self.event_manager.notify_sequential(local_event)
         self.assertFalse(example_var)
         self.assertTrue(example_var2)
 
     def test_notify_class_sequential(self) -> None:
 
-        lock = threading.Lock()
-
         @self.event_manager.register_class
         class TestClass:
             """
@@ -388,9 +761,7 @@ class TestEventManager(unittest.TestCase):
 
             @self.event_manager.register_method(self.test_event2)
             def test_method(self, _):
-                lock.acquire()
                 self.test_var = True
-                lock.release()
 
             @self.event_manager.register_method(self.test_event2)
             @self.event_manager.sequential
@@ -403,19 +774,13 @@ class TestEventManager(unittest.TestCase):
             test_class_list.append(TestClass())
 
         local_event = pygame.Event(self.test_event)
-        pygame.event.post(local_event)
-
-        for event in pygame.event.get():
-            self.event_manager.notify_sequential(event)
+        self.event_manager.notify_sequential(local_event)
         for item in test_class_list:
             self.assertFalse(item.test_var)
             self.assertFalse(item.test_var2)
 
         local_event = pygame.Event(self.test_event2)
-        pygame.event.post(local_event)
-
-        for event in pygame.event.get():
-            self.event_manager.notify_sequential(event)
+        self.event_manager.notify_sequential(local_event)
         for item in test_class_list:
             self.assertFalse(item.test_var)
             self.assertTrue(item.test_var2)
@@ -1,8 +1,8 @@
 from io import StringIO
 import json
 import pathlib
+import queue
 import sys
-import threading
 from typing import Callable, cast
 import unittest
 
@@ -13,6 +13,7 @@ sys.path.append(str(pathlib.Path.cwd()))
 from src.simple_events.key_manager import (  # noqa: E402
     getKeyListener,
     KeyListener,
+    notifyKeyListeners,
 )
 
 from src.simple_events.key_map import (  # noqa: E402
@@ -63,6 +64,17 @@ class TestKeyMap(unittest.TestCase):
         self.assertNotIn(test_bind, self.keymap.key_binds.get(start_key, []))
         self.assertIn(test_bind, self.keymap.key_binds.get(new_key, []))
 
+    def test_rebind_copy_on_write(self) -> None:
+        self.keymap.generate_bind("test_bind", pygame.K_9)
+        self.keymap.generate_bind("test_bind2", pygame.K_9)
+
+        # A list held by a reader, such as a dispatching listener, is left untouched
+        old_list = self.keymap.key_binds[pygame.K_9]
+        self.keymap.rebind(KeyBind("test_bind", None), pygame.K_0)
+
+        self.assertEqual(len(old_list), 2)
+        self.assertEqual(len(self.keymap.key_binds[pygame.K_9]), 1)
+
     def test_get_bound_key(self) -> None:
         bind_name = "test_bind"
         start_key = pygame.K_9
@@ -75,6 +87,19 @@ class TestKeyMap(unittest.TestCase):
         self.assertEqual(key, start_key)
         self.assertEqual(start_mod, mod)
 
+    def test_get_bound_key_stale_index(self) -> None:
+        bind_name = "test_bind"
+        self.keymap.generate_bind(bind_name, pygame.K_9)
+        self.assertEqual(self.keymap.get_bound_key(bind_name), (pygame.K_9, None))
+
+        # Changing key_binds directly leaves the index behind, but lookups recover
+        self.keymap.key_binds.clear()
+        self.keymap.key_binds[pygame.K_0] = [KeyBind(bind_name, None)]
+        self.assertEqual(self.keymap.get_bound_key(bind_name), (pygame.K_0, None))
+
+        self.keymap.key_binds.clear()
+        self.assertRaises(ValueError, self.keymap.get_bound_key, bind_name)
+
     def test_remove_bind(self) -> None:
         bind_name = "test_bind"
         start_key = pygame.K_9
@@ -408,10 +433,12 @@ class TestKeyListener(unittest.TestCase):
     def tearDown(self) -> None:
         self.key_listener.key_map.key_binds.clear()
         self.key_listener._key_hooks.clear()
+        self.key_listener._key_hook_keys.clear()
         self.key_listener._assigned_classes.clear()
         self.key_listener._class_listener_binds.clear()
         self.key_listener._class_listeners.clear()
         self.key_listener._class_listener_instances.clear()
+        self.key_listener._callables_cache.clear()
 
     def test_sequential_tag(self) -> None:
 
@@ -447,7 +474,7 @@ class TestKeyListener(unittest.TestCase):
         found_bind1 = False
         found_bind2 = False
 
-        for bind_name, _, _ in self.key_listener._key_hooks.keys():
+        for bind_name, _, _ in self.key_listener._key_hooks:
             match bind_name:
                 case "test_bind0":
                     found_bind0 = True
@@ -486,6 +513,54 @@ class TestKeyListener(unittest.TestCase):
         )
         self.assertIn(test_func, bind2_list)
 
+    def test_callables_cache(self) -> None:
+
+        def test_func(_) -> None:
+            pass
+
+        def test_func2(_) -> None:
+            pass
+
+        self.key_listener.bind("test_bind0", pygame.K_0)(test_func)
+        self.key_listener.bind("test_bind1", pygame.K_0)(test_func2)
+        event = pygame.Event(pygame.KEYDOWN, key=pygame.K_0, mod=pygame.KMOD_NONE)
+
+        callables = self.key_listener._get_callables(event)
+        self.assertEqual(list(callables.concurrent_functions), [test_func, test_func2])
+        self.assertIn(
+            ("test_bind0", pygame.KEYDOWN), self.key_listener._callables_cache
+        )
+
+        self.key_listener.unbind(test_func)
+        callables = self.key_listener._get_callables(event)
+        self.assertEqual(list(callables.concurrent_functions), [test_func2])
+
+        # Rebinding changes the key map, which is read fresh for every event
+        self.key_listener.rebind("test_bind1", pygame.K_1)
+        callables = self.key_listener._get_callables(event)
+        self.assertEqual(list(callables.concurrent_functions), [])
+
+    def test_unbound_event_type(self) -> None:
+
+        def test_func(_) -> None:
+            pass
+
+        self.key_listener.bind("test_bind0", pygame.K_0, event_type=pygame.KEYUP)(
+            test_func
+        )
+        self.assertIn(pygame.KEYUP, self.key_listener._bound_event_types)
+
+        callables = self.key_listener._get_callables(
+            pygame.Event(pygame.KEYUP, key=pygame.K_0, mod=pygame.KMOD_NONE)
+        )
+        self.assertIn(test_func, callables.concurrent_functions)
+
+        # Same key, but nothing is bound for this event type
+        callables = self.key_listener._get_callables(
+            pygame.Event(pygame.MOUSEMOTION, key=pygame.K_0, mod=pygame.KMOD_NONE)
+        )
+        self.assertFalse(callables.concurrent_functions)
+
     def test_bind_sequential(self) -> None:
 
         @self.key_listener.sequential
@@ -502,7 +577,7 @@ class TestKeyListener(unittest.TestCase):
         found_bind1 = False
         found_bind2 = False
 
-        for bind_name, _, _ in self.key_listener._key_hooks.keys():
+        for bind_name, _, _ in self.key_listener._key_hooks:
             match bind_name:
                 case "test_bind0":
                     found_bind0 = True
@@ -541,6 +616,27 @@ class TestKeyListener(unittest.TestCase):
         )
         self.assertIn(test_func, bind2_list)
 
+    def test_rebind_keywords(self) -> None:
+
+        self.key_listener.bind("test_bind0", pygame.K_0)
+        self.key_listener.bind("test_bind1", {"button": 0})
+
+        old_bind = self.key_listener.rebind("test_bind0", new_key=pygame.K_1)
+        self.assertEqual(old_bind, (pygame.K_0, None))
+        self.assertEqual(
+            self.key_listener.key_map.get_bound_key("test_bind0"), (pygame.K_1, None)
+        )
+
+        old_joystick_data = self.key_listener.rebind(
+            "test_bind1", new_joystick_data={"button": 1}
+        )
+        self.assertEqual(old_joystick_data, {"button": 0})
+        self.assertEqual(
+            self.key_listener.joy_map.get_bound_joystick_event("test_bind1"),
+            {"button": 1},
+        )
+        self.key_listener.joy_map.remove_bind("test_bind1")
+
     def test_unbind(self) -> None:
 
         def test_func(_) -> None:
@@ -559,7 +655,7 @@ class TestKeyListener(unittest.TestCase):
         )
         self.assertNotIn(
             test_func,
-            cast(list[Callable], bind0_list),
+            cast(dict[Callable, None], bind0_list),
         )
 
         bind1_list = self.key_listener._key_hooks.get(
@@ -567,7 +663,7 @@ class TestKeyListener(unittest.TestCase):
         )
         self.assertIn(
             test_func,
-            cast(list[Callable], bind1_list),
+            cast(dict[Callable, None], bind1_list),
         )
 
         bind2_list = self.key_listener._key_hooks.get(
@@ -575,9 +671,21 @@ class TestKeyListener(unittest.TestCase):
         )
         self.assertIn(
             test_func,
-            cast(list[Callable], bind2_list),
+            cast(dict[Callable, None], bind2_list),
+        )
+        self.assertEqual(
+            self.key_listener._key_hook_keys.get(test_func),
+            [
+                ("test_bind1", True, pygame.KEYDOWN),
+                ("test_bind2", True, pygame.KEYDOWN),
+            ],
         )
 
+        self.key_listener.unbind(test_func)
+        for bind_list in self.key_listener._key_hooks.values():
+            self.assertNotIn(test_func, bind_list)
+        self.assertNotIn(test_func, self.key_listener._key_hook_keys)
+
     def test_clear_bind(self) -> None:
 
         def test_func(_) -> None:
@@ -607,13 +715,13 @@ class TestKeyListener(unittest.TestCase):
         )
         self.assertIn(
             test_func,
-            cast(list[Callable], bind1_list),
+            cast(dict[Callable, None], bind1_list),
         )
 
         self.key_listener.clear_bind("test_bind0", True)
 
-        bind0_list = self.key_listener._key_hooks.get(
-            ("test_bind0", True, pygame.KEYDOWN), []
+        self.assertNotIn(
+            ("test_bind0", True, pygame.KEYDOWN), self.key_listener._key_hooks
         )
 
         binds = [
@@ -632,10 +740,9 @@ class TestKeyListener(unittest.TestCase):
                 pass
 
         self.assertHasAttr(TestClass.test_method, "_assigned_managers")
-        assigned_listener_sets: list[
-            tuple[KeyListener, str, int | None, int | None, int]
+        assigned_listeners: dict[
+            KeyListener, list[tuple[str, int | None, int | None, int, dict | None]]
         ] = getattr(TestClass.test_method, "_assigned_managers")
-        assigned_listeners = [set[0] for set in assigned_listener_sets]
         self.assertIn(self.key_listener, assigned_listeners)
 
     def test_register_class(self) -> None:
@@ -651,17 +758,12 @@ class TestKeyListener(unittest.TestCase):
         # Verify attribute cleanup
         self.assertNotHasAttr(TestClass.test_method, "_assigned_listeners")
         # Verify class in assigned classes
-        self.assertIn(TestClass, self.key_listener._assigned_classes.keys())
+        self.assertIn(TestClass, self.key_listener._assigned_classes)
         # Verify method in listeners
-        self.assertIn(
-            TestClass.test_method, self.key_listener._class_listener_binds.keys()
-        )
+        self.assertIn(TestClass.test_method, self.key_listener._class_listener_binds)
         self.assertIn(
             test_instance,
-            cast(
-                list[TestClass],
-                self.key_listener._class_listener_instances.get(TestClass),
-            ),
+            list(self.key_listener._class_listener_instances[TestClass].values()),
         )
         listeners = self.key_listener._class_listeners.get(
             ("test_bind", True, pygame.KEYDOWN), []
@@ -687,9 +789,7 @@ class TestKeyListener(unittest.TestCase):
         test_instance = TestClass()  # noqa: F841
 
         self.key_listener.unbind_method(TestClass.test_method)
-        self.assertNotIn(
-            TestClass.test_method, self.key_listener._class_listener_binds.keys()
-        )
+        self.assertNotIn(TestClass.test_method, self.key_listener._class_listener_binds)
 
         listeners = self.key_listener._class_listeners.get(
             ("test_bind", True, pygame.KEYDOWN), []
@@ -713,10 +813,8 @@ class TestKeyListener(unittest.TestCase):
 
         self.key_listener.deregister_class(TestClass)
         # Verify method removed from listeners
-        self.assertNotIn(
-            TestClass.test_method, self.key_listener._class_listener_binds.keys()
-        )
-        self.assertNotIn(TestClass, self.key_listener._class_listener_instances.keys())
+        self.assertNotIn(TestClass.test_method, self.key_listener._class_listener_binds)
+        self.assertNotIn(TestClass, self.key_listener._class_listener_instances)
 
         listeners = self.key_listener._key_hooks.get(
             ("test_bind", True, pygame.KEYDOWN), []
@@ -725,16 +823,65 @@ class TestKeyListener(unittest.TestCase):
         # Verify method/object pair are associated with the event
         self.assertNotIn(listener_pair, listeners)
 
+    def test_deregister_class_multiple_binds(self) -> None:
+
+        @self.key_listener.register_class
+        class TestClass:
+            @self.key_listener.bind_method("test_bind")
+            @self.key_listener.bind_method("test_bind2")
+            def test_method(self, _):
+                pass
+
+        self.key_listener.deregister_class(TestClass)
+
+        self.assertNotIn(TestClass, self.key_listener._assigned_classes)
+        listener_pair = (TestClass.test_method, TestClass)
+        for bind_name in ("test_bind", "test_bind2"):
+            listeners = self.key_listener._class_listeners.get(
+                (bind_name, True, pygame.KEYDOWN), []
+            )
+            self.assertNotIn(listener_pair, listeners)
+
+    def test_deregister_class_inherited(self) -> None:
+
+        calls: list[str] = []
+
+        class BaseClass:
+            @self.key_listener.bind_method("test_bind", pygame.K_0)
+            @self.key_listener.sequential
+            def test_method(self, _):
+                calls.append(type(self).__name__)
+
+        @self.key_listener.register_class
+        class TestClass(BaseClass):
+            pass
+
+        @self.key_listener.register_class
+        class TestClass2(BaseClass):
+            pass
+
+        test_instance = TestClass()  # noqa: F841
+        test_instance2 = TestClass2()  # noqa: F841
+
+        local_event = pygame.event.Event(
+            pygame.KEYDOWN, unicode="0", key=pygame.K_0, mod=pygame.KMOD_NONE
+        )
+        self.key_listener.notify(local_event)
+        self.assertEqual(sorted(calls), ["TestClass", "TestClass2"])
+
+        # Only the deregistered class stops listening
+        self.key_listener.deregister_class(TestClass)
+        calls.clear()
+        self.key_listener.notify(local_event)
+        self.assertEqual(calls, ["TestClass2"])
+        self.assertIn(BaseClass.test_method, self.key_listener._class_listener_binds)
+
     def test_notify_concurrent(self) -> None:
 
-        example_var = False
-        lock = threading.Lock()
+        calls: queue.SimpleQueue[bool] = queue.SimpleQueue()
 
         def test_func(_) -> None:
-            nonlocal example_var
-            lock.acquire()
-            example_var = True
-            lock.release()
+            calls.put(True)
 
         self.key_listener.bind("test_bind0", pygame.K_0, pygame.KMOD_ALT)(test_func)
 
@@ -743,57 +890,41 @@ class TestKeyListener(unittest.TestCase):
         local_event = pygame.event.Event(
             pygame.KEYDOWN, unicode="1", key=pygame.K_1, mod=pygame.KMOD_NONE
         )
-        pygame.event.post(local_event)
-        for event in pygame.event.get():
-            self.key_listener.notify_concurrent(event)
+        self.key_listener.notify_concurrent(local_event)
         # False, because the wrong key was pressed
-        self.assertFalse(example_var)
+        self.assertTrue(calls.empty())
 
         local_event = pygame.event.Event(
             pygame.KEYDOWN, unicode="0", key=pygame.K_0, mod=pygame.KMOD_NONE
         )
-        pygame.event.post(local_event)
-        for event in pygame.event.get():
-            self.key_listener.notify_concurrent(event)
+        self.key_listener.notify_concurrent(local_event)
         # False, because Alt isn't held
-        self.assertFalse(example_var)
+        self.assertTrue(calls.empty())
 
         local_event = pygame.event.Event(
             pygame.KEYDOWN, unicode="0", key=pygame.K_0, mod=pygame.KMOD_ALT
         )
-        pygame.event.post(local_event)
-        for event in pygame.event.get():
-            self.key_listener.notify_concurrent(event)
+        self.key_listener.notify_concurrent(local_event)
         # True, because both 0 and Alt are pressed
-        self.assertTrue(example_var)
-
-        # Reset example var for other binding test
-        example_var = False
+        self.assertTrue(calls.get(timeout=1))
 
         local_event = pygame.event.Event(
             pygame.KEYDOWN, unicode="9", key=pygame.K_9, mod=pygame.KMOD_NONE
         )
-        pygame.event.post(local_event)
-        for event in pygame.event.get():
-            self.key_listener.notify_concurrent(event)
+        self.key_listener.notify_concurrent(local_event)
         # True, because exact key combo match
-        self.assertTrue(example_var)
-
-        # Reset again
-        example_var = False
+        self.assertTrue(calls.get(timeout=1))
 
         local_event = pygame.event.Event(
             pygame.KEYDOWN, unicode="9", key=pygame.K_9, mod=pygame.KMOD_ALT
         )
-        pygame.event.post(local_event)
-        for event in pygame.event.get():
-            self.key_listener.notify_concurrent(event)
+        self.key_listener.notify_concurrent(local_event)
         # True, despite Alt also being pressed
-        self.assertTrue(example_var)
+        self.assertTrue(calls.get(timeout=1))
 
     def test_notify_class_concurrent(self) -> None:
 
-        lock = threading.Lock()
+        calls: queue.SimpleQueue[object] = queue.SimpleQueue()
 
         @self.key_listener.register_class
         class TestClass:
@@ -806,9 +937,8 @@ class TestKeyListener(unittest.TestCase):
 
             @self.key_listener.bind_method("test_bind", pygame.K_0)
             def test_method(self, _):
-                lock.acquire()
                 self.test_var = True
-                lock.release()
+                calls.put(self)
 
         test_class_list: list[TestClass] = []
 
@@ -818,24 +948,20 @@ class TestKeyListener(unittest.TestCase):
         local_event = pygame.event.Event(
             pygame.KEYDOWN, unicode="9", key=pygame.K_9, mod=pygame.KMOD_NONE
         )
-        pygame.event.post(local_event)
-
-        for event in pygame.event.get():
-            self.key_listener.notify_concurrent(event)
+        self.key_listener.notify_concurrent(local_event)
         for item in test_class_list:
             self.assertFalse(item.test_var)
 
         local_event = pygame.event.Event(
             pygame.KEYDOWN, unicode="0", key=pygame.K_0, mod=pygame.KMOD_NONE
         )
-        pygame.event.post(local_event)
-
-        for event in pygame.event.get():
-            self.key_listener.notify_concurrent(event)
+        self.key_listener.notify_concurrent(local_event)
+        for _ in test_class_list:
+            self.assertIn(calls.get(timeout=1), test_class_list)
         for item in test_class_list:
             self.assertTrue(item.test_var)
 
-    def test_notify_sequential(self) -> None:
+    def test_notify_key_listeners(self) -> None:
 
         example_var = False
 
@@ -844,60 +970,58 @@ class TestKeyListener(unittest.TestCase):
             nonlocal example_var
             example_var = True
 
-        self.key_listener.bind("test_bind0", pygame.K_0, pygame.KMOD_ALT)(test_func)
+        self.key_listener.bind("test_bind0", pygame.K_0, None)(test_func)
 
-        self.key_listener.bind("test_bind9", pygame.K_9, None)(test_func)
+        self.assertIn(self.key_listener, KeyListener._listener_snapshot)
 
-        local_event = pygame.event.Event(
-            pygame.KEYDOWN, unicode="1", key=pygame.K_1, mod=pygame.KMOD_NONE
+        notifyKeyListeners(
+            pygame.Event(pygame.KEYDOWN, key=pygame.K_0, mod=pygame.KMOD_NONE)
         )
-        pygame.event.post(local_event)
-        for event in pygame.event.get():
-            self.key_listener.notify_concurrent(event)
-        # False, because the wrong key was pressed
-        self.assertFalse(example_var)
-
-        local_event = pygame.event.Event(
-            pygame.KEYDOWN, unicode="0", key=pygame.K_0, mod=pygame.KMOD_NONE
-        )
-        pygame.event.post(local_event)
-        for event in pygame.event.get():
-            self.key_listener.notify_sequential(event)
-        # False, because Alt isn't held
-        self.assertFalse(example_var)
-
-        local_event = pygame.event.Event(
-            pygame.KEYDOWN, unicode="0", key=pygame.K_0, mod=pygame.KMOD_ALT
-        )
-        pygame.event.post(local_event)
-        for event in pygame.event.get():
-            self.key_listener.notify_sequential(event)
-        # True, because both 0 and Alt are pressed
         self.assertTrue(example_var)
 
-        # Reset example var for other binding test
+        # Listeners removed from _listeners directly are no longer notified
         example_var = False
+        KeyListener._listeners.pop("TestCase")
+        try:
+            notifyKeyListeners(
+                pygame.Event(pygame.KEYDOWN, key=pygame.K_0, mod=pygame.KMOD_NONE)
+            )
+            self.assertFalse(example_var)
+        finally:
+            KeyListener._listeners["TestCase"] = self.key_listener
 
-        local_event = pygame.event.Event(
-            pygame.KEYDOWN, unicode="9", key=pygame.K_9, mod=pygame.KMOD_NONE
-        )
-        pygame.event.post(local_event)
-        for event in pygame.event.get():
-            self.key_listener.notify_sequential(event)
-        # True, because exact key combo match
-        self.assertTrue(example_var)
+    def test_notify_sequential(self) -> None:
 
-        # Reset again
         example_var = False
 
-        local_event = pygame.event.Event(
-            pygame.KEYDOWN, unicode="9", key=pygame.K_9, mod=pygame.KMOD_ALT
-        )
-        pygame.event.post(local_event)
-        for event in pygame.event.get():
-            self.key_listener.notify_sequential(event)
-        # True, despite Alt also being pressed
-        self.assertTrue(example_var)
+        @self.key_listener.sequential
+        def test_func(_) -> None:
+            nonlocal example_var
+            example_var = True
+
+        self.key_listener.bind("test_bind0", pygame.K_0, pygame.KMOD_ALT)(test_func)
+
+        self.key_listener.bind("test_bind9", pygame.K_9, None)(test_func)
+
+        cases = [
+            # False, because the wrong key was pressed
+            (pygame.K_1, pygame.KMOD_NONE, False),
+            # False, because Alt isn't held
+            (pygame.K_0, pygame.KMOD_NONE, False),
+            # True, because both 0 and Alt are pressed
+            (pygame.K_0, pygame.KMOD_ALT, True),
+            # True, because exact key combo match
+            (pygame.K_9, pygame.KMOD_NONE, True),
+            # True, despite Alt also being pressed
+            (pygame.K_9, pygame.KMOD_ALT, True),
+        ]
+        for key, mod, expected in cases:
+            with self.subTest(key=pygame.key.name(key), mod=mod):
+                example_var = False
+                self.key_listener.notify_sequential(
+                    pygame.event.Event(pygame.KEYDOWN, key=key, mod=mod)
+                )
+                self.assertEqual(example_var, expected)
 
     def test_notify_class_sequential(self) -> None:
 
@@ -923,20 +1047,14 @@ class TestKeyListener(unittest.TestCase):
         local_event = pygame.event.Event(
             pygame.KEYDOWN, unicode="9", key=pygame.K_9, mod=pygame.KMOD_NONE
         )
-        pygame.event.post(local_event)
-
-        for event in pygame.event.get():
-            self.key_listener.notify_sequential(event)
+        self.key_listener.notify_sequential(local_event)
         for item in test_class_list:
             self.assertFalse(item.test_var)
 
         local_event = pygame.event.Event(
             pygame.KEYDOWN, unicode="0", key=pygame.K_0, mod=pygame.KMOD_NONE
         )
-        pygame.event.post(local_event)
-
-        for event in pygame.event.get():
-            self.key_listener.notify_sequential(event)
+        self.key_listener.notify_sequential(local_event)
         for item in test_class_list:
             self.assertTrue(item.test_var)
 